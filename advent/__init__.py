@@ -0,0 +1,19 @@
+"""Tools for running the AdventOfCode solutions
+
+The solutions in `code/NN/part_P.py` are standalone scripts. This
+package imports them in-process so that they can be run, timed and
+tested together without paying for a fresh interpreter per script.
+
+Every part exposes the same small interface:
+
+- `part_1.parse(fileobj)` reads the puzzle input into plain data that
+  both parts share. Solvers never mutate it.
+
+- `part_P.solve(parsed)` returns the answer that `main` prints.
+
+- `part_2.solve_both(parsed)` is optional, and returns the answers to
+  both parts as a tuple. Days where the parts share expensive work
+  (enumerating the same combinations, say) define it so that the work
+  is only done once.
+
+"""
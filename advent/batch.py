@@ -0,0 +1,134 @@
+"""Solve one day/part for many input files on a process pool
+
+Usage (from the top of the repository):
+
+    python3 -m advent.batch 6 1 inputs/ more/input_a more/input_b -j 8
+
+Directories are expanded to the files they contain. Each worker
+process imports the day once, so the imports (numpy included) and the
+module-level tables of a day are paid for once per worker instead of
+once per file. Answers are written as `filename<TAB>answer` lines as
+soon as each file is solved, so the order of the output is not the
+order of the inputs.
+
+"""
+
+import concurrent.futures
+import os
+import sys
+
+from advent import days
+from advent import inputs
+from advent import run
+
+# The modules of the day being solved, loaded once in each worker
+_modules = None
+
+def expand_paths(paths):
+    """Return the files named by `paths`, expanding directories
+
+    Hidden files inside directories are skipped.
+
+    >>> import tempfile
+    >>> with tempfile.TemporaryDirectory() as directory:
+    ...     for name in ('b', 'a', '.hidden'):
+    ...         open(os.path.join(directory, name), 'w').close()
+    ...     files = expand_paths([directory, 'other'])
+    ...     [os.path.basename(f) for f in files]
+    ['a', 'b', 'other']
+
+    """
+    filenames = []
+    for path in paths:
+        if os.path.isdir(path):
+            filenames.extend(
+                os.path.join(path, name)
+                for name in sorted(os.listdir(path))
+                if not name.startswith('.')
+                and os.path.isfile(os.path.join(path, name))
+            )
+        else:
+            filenames.append(path)
+
+    return filenames
+
+def format_batch_answer(answer):
+    """Return an answer on a single line
+
+    >>> format_batch_answer(42)
+    '42'
+    >>> format_batch_answer([1, 2])
+    '1 2'
+
+    """
+    return run.format_answer(answer).rstrip('\n').replace('\n', ' ')
+
+def load_worker(day):
+    """Import the day in a worker process"""
+    global _modules
+    _modules = days.load_day(day)
+
+def solve_file(part, filename):
+    """Solve a part for one file in a worker, returning the answer text"""
+    parsed = inputs.parse_file(_modules[1], filename)
+    return format_batch_answer(_modules[part].solve(parsed))
+
+def solve_files(day, part, filenames, workers=None):
+    """Yield (filename, answer, error) for each file as it is solved
+
+    Exactly one of answer and error is None.
+
+    >>> import tempfile
+    >>> with tempfile.TemporaryDirectory() as directory:
+    ...     filename = os.path.join(directory, 'threshold')
+    ...     with open(filename, 'w') as f:
+    ...         _ = f.write('100\\n')
+    ...     [result[1:] for result in solve_files(20, 1, [filename], workers=1)]
+    [('6', None)]
+
+    """
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=load_worker,
+        initargs=(day, ),
+    ) as executor:
+        futures = {
+            executor.submit(solve_file, part, filename): filename
+            for filename in filenames
+        }
+
+        for future in concurrent.futures.as_completed(futures):
+            filename = futures[future]
+            try:
+                yield (filename, future.result(), None)
+            except Exception as error:
+                yield (filename, None, error)
+
+def main(day, part, paths, workers):
+    """Solve a day/part for every file, printing the answers as they come"""
+    filenames = expand_paths(paths)
+
+    failures = 0
+    for (filename, answer, error) in solve_files(day, part, filenames, workers):
+        if error is None:
+            print('{}\t{}'.format(filename, answer), flush=True)
+        else:
+            failures += 1
+            print('{}\t{}: {}'.format(filename, type(error).__name__, error),
+                  file=sys.stderr, flush=True)
+
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('day', type=int)
+    parser.add_argument('part', type=int, choices=days.PARTS)
+    parser.add_argument('paths', nargs='+', metavar='path',
+                        help='Input files, or directories of input files')
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help='Number of worker processes (default: cpu count)')
+    args = parser.parse_args()
+
+    sys.exit(main(**vars(args)))
@@ -0,0 +1,13 @@
+"""Benchmark the solutions on synthetic inputs of increasing size
+
+- :mod:`advent.bench.generators` builds a deterministic, seeded input
+  for each day at a given size.
+
+- :mod:`advent.bench.harness` times each day's parse and parts across
+  a ladder of sizes, writes the results as JSON and compares them
+  against a stored baseline.
+
+- :mod:`advent.bench.adventcoin` measures how many MD5 hashes per
+  second day 4 tests.
+
+"""
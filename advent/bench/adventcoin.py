@@ -0,0 +1,71 @@
+"""Measure how many MD5 hashes per second day 4 can test
+
+Day 4 tests candidates one MD5 hash at a time, so its running time is
+the number of candidates divided by this rate. This compares testing
+each candidate with `check_solution` (hashing the whole string and
+comparing its hexadecimal digest) to `find_solutions` (copying the
+hash state of the shared prefix and comparing the raw digest), in a
+single process.
+
+Usage (from the top of the repository):
+
+    python3 -m advent.bench.adventcoin [--count N] [--key KEY] [--zeros N]
+
+"""
+
+import time
+
+from advent import days
+
+ENGINES = ('check_solution', 'find_solutions')
+
+def hash_rate(engine, key, start, count, num_zeros):
+    """Return the number of candidates an engine tests per second
+
+    >>> all(hash_rate(engine, 'abcdef', 0, 2000, 5) > 0 for engine in ENGINES)
+    True
+
+    """
+    part_1 = days.load_part(4, 1)
+
+    started = time.perf_counter()
+    if engine == 'check_solution':
+        for solution in range(start, start + count):
+            part_1.check_solution(key, solution, num_zeros)
+    else:
+        for _ in part_1.find_solutions(key, start, start + count, num_zeros):
+            pass
+    elapsed = time.perf_counter() - started
+
+    return count / elapsed
+
+def main(key, start, count, zeros, repeat):
+    """Report the hash rate of each engine"""
+    rates = {}
+    for engine in ENGINES:
+        rates[engine] = max(
+            hash_rate(engine, key, start, count, zeros)
+            for _ in range(repeat)
+        )
+        print("{:<15} {:12,.0f} hashes/s".format(engine, rates[engine]))
+
+    print("speedup         {:12.2f}x".format(
+        rates['find_solutions'] / rates['check_solution']))
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--key', default='abcdef',
+                        help='Secret key to hash candidates with')
+    parser.add_argument('--start', type=int, default=1000000,
+                        help='First candidate to test')
+    parser.add_argument('--count', type=int, default=500000,
+                        help='Number of candidates to test')
+    parser.add_argument('--zeros', type=int, default=5,
+                        help='Number of leading zeros to look for')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Take the best of this many runs')
+    args = parser.parse_args()
+
+    main(**vars(args))
@@ -0,0 +1,390 @@
+"""Deterministic, size-scalable puzzle inputs for every day
+
+Each generator takes a size and a `random.Random` instance and returns
+the text of a puzzle input. What the size means depends on the day
+(characters, lines, cities, grid width, ...) and is described in each
+generator's docstring. The same size and seed always produce the same
+input.
+
+>>> generate(1, 8, seed=0) == generate(1, 8, seed=0)
+True
+>>> len(generate(1, 8))
+8
+
+"""
+
+import json
+import random
+import string
+
+DEFAULT_SEED = 2015
+
+GENERATORS = {}
+
+# Sizes to benchmark each day at by default. The solutions for some
+# days are exponential in the size of their input, so their ladders
+# are short.
+LADDERS = {}
+
+def generator(day, ladder):
+    """Register a generator for a day with its default size ladder"""
+    def decorator(function):
+        GENERATORS[day] = function
+        LADDERS[day] = tuple(ladder)
+        return function
+
+    return decorator
+
+def generate(day, size, seed=DEFAULT_SEED):
+    """Return the text of a generated input for a day"""
+    rng = random.Random('{}/{}/{}'.format(day, size, seed))
+    return GENERATORS[day](size, rng)
+
+def lowercase_name(index):
+    """Return a unique lowercase name for an index
+
+    >>> [lowercase_name(i) for i in (0, 1, 25, 26, 27)]
+    ['a', 'b', 'z', 'ba', 'bb']
+
+    """
+    name = ''
+    while True:
+        (index, remainder) = divmod(index, 26)
+        name = string.ascii_lowercase[remainder] + name
+        if index == 0:
+            return name
+
+def capitalized_name(index):
+    """Return a unique capitalized name for an index
+
+    >>> capitalized_name(27)
+    'Bb'
+
+    """
+    return lowercase_name(index).capitalize()
+
+@generator(1, ladder=(10**4, 10**5, 10**6))
+def day_01(size, rng):
+    """Return `size` parentheses"""
+    return ''.join(rng.choice('()') for _ in range(size))
+
+@generator(2, ladder=(10**3, 10**4, 10**5))
+def day_02(size, rng):
+    """Return `size` lines of box dimensions"""
+    return ''.join(
+        '{}x{}x{}\n'.format(
+            rng.randint(1, 30),
+            rng.randint(1, 30),
+            rng.randint(1, 30),
+        )
+        for _ in range(size)
+    )
+
+@generator(3, ladder=(10**4, 10**5, 10**6))
+def day_03(size, rng):
+    """Return `size` moves (without a trailing newline)"""
+    return ''.join(rng.choice('^v<>') for _ in range(size))
+
+@generator(4, ladder=())
+def day_04(size, rng):
+    """Return a secret key of `size` letters
+
+    The work needed to mine a coin does not depend on the key, so
+    there is no default ladder for this day.
+
+    """
+    return ''.join(rng.choice(string.ascii_lowercase) for _ in range(size)) + '\n'
+
+@generator(5, ladder=(10**3, 10**4, 10**5))
+def day_05(size, rng):
+    """Return `size` lines of 16 lowercase letters"""
+    return ''.join(
+        ''.join(rng.choice(string.ascii_lowercase) for _ in range(16)) + '\n'
+        for _ in range(size)
+    )
+
+@generator(6, ladder=(10, 100, 300))
+def day_06(size, rng, grid=1000):
+    """Return `size` light commands on a `grid` by `grid` square"""
+    lines = []
+    for _ in range(size):
+        command = rng.choice(['turn on', 'turn off', 'toggle'])
+        (top, bottom) = sorted(rng.randrange(grid) for _ in range(2))
+        (left, right) = sorted(rng.randrange(grid) for _ in range(2))
+        lines.append('{} {},{} through {},{}\n'.format(
+            command, top, left, bottom, right))
+
+    return ''.join(lines)
+
+@generator(7, ladder=(10**2, 10**3, 10**4))
+def day_07(size, rng):
+    """Return a circuit with `size` wires
+
+    Wire "b" is a constant input, every other wire is driven by wires
+    defined before it, and wire "a" is the last one.
+
+    """
+    names = ['b'] + [lowercase_name(i) for i in range(2, size)] + ['a']
+    lines = ['{} -> b\n'.format(rng.randrange(1 << 16))]
+    for (index, target) in enumerate(names[1:], start=1):
+        first = rng.choice(names[:index])
+        second = rng.choice(names[:index])
+        kind = rng.randrange(6)
+        if kind == 0:
+            source = str(rng.randrange(1 << 16))
+        elif kind == 1:
+            source = 'NOT {}'.format(first)
+        elif kind == 2:
+            source = '{} AND {}'.format(first, second)
+        elif kind == 3:
+            source = '{} OR {}'.format(first, second)
+        elif kind == 4:
+            source = '{} LSHIFT {}'.format(first, rng.randint(1, 15))
+        else:
+            source = '{} RSHIFT {}'.format(first, rng.randint(1, 15))
+
+        lines.append('{} -> {}\n'.format(source, target))
+
+    rng.shuffle(lines)
+
+    return ''.join(lines)
+
+@generator(8, ladder=(10**2, 10**3, 10**4))
+def day_08(size, rng):
+    """Return `size` string literals with escape sequences"""
+    def character():
+        kind = rng.randrange(10)
+        if kind == 0:
+            return '\\\\'
+        elif kind == 1:
+            return '\\"'
+        elif kind == 2:
+            return '\\x{:02x}'.format(rng.randrange(256))
+        else:
+            return rng.choice(string.ascii_lowercase)
+
+    return ''.join(
+        '"{}"\n'.format(''.join(character() for _ in range(rng.randint(0, 30))))
+        for _ in range(size)
+    )
+
+@generator(9, ladder=(4, 6, 8))
+def day_09(size, rng):
+    """Return the distances between every pair of `size` cities"""
+    cities = [capitalized_name(i) for i in range(size)]
+    return ''.join(
+        '{} to {} = {}\n'.format(start, end, rng.randint(1, 200))
+        for (i, start) in enumerate(cities)
+        for end in cities[i+1:]
+    )
+
+@generator(10, ladder=(1, 2, 4))
+def day_10(size, rng):
+    """Return `size` starting digits"""
+    return ''.join(rng.choice('123') for _ in range(size)) + '\n'
+
+@generator(11, ladder=(8, ))
+def day_11(size, rng):
+    """Return a password of `size` letters without confusing letters"""
+    letters = [c for c in string.ascii_lowercase if c not in 'iol']
+    return ''.join(rng.choice(letters) for _ in range(size)) + '\n'
+
+@generator(12, ladder=(10**3, 10**4, 10**5))
+def day_12(size, rng):
+    """Return a JSON document holding `size` values"""
+    def value(remaining):
+        if remaining <= 1:
+            return rng.choice([rng.randint(-100, 100), 'red', 'blue'])
+
+        children = []
+        while remaining > 0:
+            child = rng.randint(1, remaining)
+            children.append(value(child))
+            remaining -= child
+
+        if rng.random() < 0.5:
+            return children
+
+        return {lowercase_name(i): child for (i, child) in enumerate(children)}
+
+    return json.dumps(value(size)) + '\n'
+
+@generator(13, ladder=(4, 6, 7))
+def day_13(size, rng):
+    """Return happiness ratings between every pair of `size` guests"""
+    guests = [capitalized_name(i) for i in range(size)]
+    lines = []
+    for person in guests:
+        for next_to in guests:
+            if person == next_to:
+                continue
+
+            units = rng.randint(-100, 100)
+            lines.append(
+                '{} would {} {} happiness units by sitting next to {}.\n'.format(
+                    person,
+                    'gain' if units >= 0 else 'lose',
+                    abs(units),
+                    next_to,
+                )
+            )
+
+    return ''.join(lines)
+
+@generator(14, ladder=(10, 100, 1000))
+def day_14(size, rng):
+    """Return `size` reindeer"""
+    return ''.join(
+        '{} can fly {} km/s for {} seconds, but then must rest for {} seconds.\n'.format(
+            capitalized_name(i),
+            rng.randint(1, 30),
+            rng.randint(1, 20),
+            rng.randint(10, 200),
+        )
+        for i in range(size)
+    )
+
+@generator(15, ladder=(2, 3, 4))
+def day_15(size, rng):
+    """Return `size` ingredients"""
+    return ''.join(
+        '{}: capacity {}, durability {}, flavor {}, texture {}, calories {}\n'.format(
+            capitalized_name(i),
+            *[rng.randint(-3, 5) for _ in range(4)],
+            rng.randint(1, 9)
+        )
+        for i in range(size)
+    )
+
+@generator(16, ladder=(500, 5000, 50000))
+def day_16(size, rng):
+    """Return `size` Sues with three known traits each"""
+    traits = [
+        'children', 'cats', 'samoyeds', 'pomeranians', 'akitas',
+        'vizslas', 'goldfish', 'trees', 'cars', 'perfumes',
+    ]
+    return ''.join(
+        'Sue {}: {}\n'.format(
+            number,
+            ', '.join(
+                '{}: {}'.format(trait, rng.randint(0, 10))
+                for trait in rng.sample(traits, 3)
+            ),
+        )
+        for number in range(1, size + 1)
+    )
+
+@generator(17, ladder=(10, 15, 20))
+def day_17(size, rng):
+    """Return `size` container sizes, some of which hold 150 liters"""
+    # Make sure there is at least one combination holding exactly 150
+    # liters, without using every container.
+    sizes = [50, 50, 50]
+    while len(sizes) < size:
+        sizes.append(rng.randint(5, 50))
+
+    rng.shuffle(sizes)
+
+    return ''.join('{}\n'.format(s) for s in sizes)
+
+@generator(18, ladder=(10, 25, 50))
+def day_18(size, rng):
+    """Return a `size` by `size` grid of lights"""
+    return ''.join(
+        ''.join(rng.choice('#.') for _ in range(size)) + '\n'
+        for _ in range(size)
+    )
+
+@generator(19, ladder=(10**2, 10**3, 10**4))
+def day_19(size, rng):
+    """Return replacements and a molecule of `size` elements"""
+    elements = ['Al', 'B', 'Ca', 'F', 'H', 'Mg', 'N', 'O', 'P', 'Si', 'Th', 'Ti']
+    lines = []
+    for element in elements:
+        for _ in range(rng.randint(1, 3)):
+            after = ''.join(rng.choice(elements) for _ in range(2))
+            lines.append('{} => {}\n'.format(element, after))
+
+    lines.append('e => HF\n')
+    lines.append('\n')
+
+    markers = ['Rn', 'Ar', 'Y']
+    molecule = ''.join(
+        rng.choice(markers) if rng.random() < 0.1 else rng.choice(elements)
+        for _ in range(size)
+    )
+    lines.append(molecule + '\n')
+
+    return ''.join(lines)
+
+@generator(20, ladder=(10**4, 10**5, 10**6))
+def day_20(size, rng):
+    """Return a present threshold of `size`"""
+    return '{}\n'.format(size)
+
+@generator(21, ladder=(50, 100, 150))
+def day_21(size, rng):
+    """Return a boss with `size` hit points
+
+    The amount of work does not grow with the hit points much; the
+    ladder only checks that the fight simulation scales.
+
+    """
+    return 'Hit Points: {}\nDamage: {}\nArmor: {}\n'.format(
+        size,
+        rng.randint(6, 9),
+        rng.randint(1, 2),
+    )
+
+@generator(22, ladder=())
+def day_22(size, rng):
+    """Return a boss with `size` hit points
+
+    Both parts always play a fixed number of random games, so there is
+    no default ladder for this day.
+
+    """
+    return 'Hit Points: {}\nDamage: {}\n'.format(size, rng.randint(8, 10))
+
+@generator(23, ladder=(10**3, 10**4, 10**5))
+def day_23(size, rng):
+    """Return a program of `size` instructions
+
+    Jumps only go forwards, so every program terminates, and halving
+    is more likely than tripling, so the registers stay small.
+
+    """
+    lines = []
+    for index in range(size):
+        register = rng.choice('ab')
+        offset = rng.randint(1, 5)
+        kind = rng.random()
+        if kind < 0.35:
+            lines.append('hlf {}\n'.format(register))
+        elif kind < 0.5:
+            lines.append('tpl {}\n'.format(register))
+        elif kind < 0.8:
+            lines.append('inc {}\n'.format(register))
+        elif kind < 0.85:
+            lines.append('jmp +{}\n'.format(offset))
+        elif kind < 0.95:
+            lines.append('jie {}, +{}\n'.format(register, offset))
+        else:
+            lines.append('jio {}, +{}\n'.format(register, offset))
+
+    return ''.join(lines)
+
+@generator(24, ladder=(10, 15, 20))
+def day_24(size, rng):
+    """Return `size` distinct package weights whose sum divides by 12"""
+    weights = rng.sample(range(1, 4 * size + 12), size)
+
+    # Bump the largest weight until the total can be split into three
+    # or four equal groups, keeping every weight distinct.
+    weights.sort()
+    while sum(weights) % 12 != 0 or len(set(weights)) != size:
+        weights[-1] += 1
+
+    rng.shuffle(weights)
+
+    return ''.join('{}\n'.format(w) for w in weights)
@@ -0,0 +1,196 @@
+"""Time each day's solution across a ladder of generated input sizes
+
+Usage (from the top of the repository):
+
+    python3 -m advent.bench.harness run -o results.json [day ...]
+    python3 -m advent.bench.harness compare baseline.json results.json
+
+`run` generates an input for every size in each day's ladder (see
+:mod:`advent.bench.generators`), times the shared parse and each
+part's `solve` through :func:`advent.run.solve_day`, and writes the
+best time of several repeats as JSON.
+
+`compare` reports every (day, size, stage) that got slower than the
+baseline by more than a threshold, and exits with a non-zero status
+if there were any.
+
+"""
+
+import json
+import os
+import platform
+import sys
+import tempfile
+
+from advent import days
+from advent import run
+from advent.bench import generators
+
+def benchmark(day, size, repeat=3, seed=generators.DEFAULT_SEED):
+    """Return the best time of each stage for a day at a given size
+
+    >>> timings = benchmark(1, 100, repeat=1)
+    >>> sorted(timings)
+    ['parse', 'part_1', 'part_2']
+
+    """
+    text = generators.generate(day, size, seed)
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, days.day_name(day))
+        with open(filename, 'w') as f:
+            f.write(text)
+
+        best = {}
+        for _ in range(repeat):
+            # Each part is timed on its own, even for days that can
+            # solve both parts together, so that results stay comparable.
+            stages = run.solve_day(day, filename, share=False)
+            for (stage, elapsed, _) in stages:
+                name = stage if stage == 'parse' else 'part_{}'.format(stage)
+                best[name] = min(elapsed, best.get(name, float('inf')))
+
+    return best
+
+def run_ladders(selected_days, repeat, seed, sizes=None, report=sys.stderr):
+    """Benchmark each day across its ladder and return the records"""
+    records = []
+    for day in selected_days:
+        ladder = sizes or generators.LADDERS[day]
+        for size in ladder:
+            timings = benchmark(day, size, repeat, seed)
+            for (stage, seconds) in sorted(timings.items()):
+                records.append({
+                    'day': day,
+                    'size': size,
+                    'stage': stage,
+                    'seconds': seconds,
+                })
+                print("{} {:>10} {:<7} {:10.4f}s".format(
+                    days.day_name(day), size, stage, seconds), file=report)
+
+    return records
+
+def record_key(record):
+    return (record['day'], record['size'], record['stage'])
+
+def find_regressions(baseline, current, threshold=0.1, min_seconds=0.001):
+    """Return (record, baseline seconds) for each slower record
+
+    Records are compared on (day, size, stage). A record regressed if
+    it took more than `threshold` (as a fraction) longer than in the
+    baseline. Timings under `min_seconds` in both runs are noise and
+    are ignored.
+
+    >>> baseline = [{'day': 1, 'size': 10, 'stage': 'parse', 'seconds': 1.0}]
+    >>> current = [{'day': 1, 'size': 10, 'stage': 'parse', 'seconds': 1.5}]
+    >>> [(r['seconds'], old) for (r, old) in find_regressions(baseline, current)]
+    [(1.5, 1.0)]
+    >>> find_regressions(baseline, current, threshold=0.6)
+    []
+    >>> find_regressions(current, baseline)
+    []
+
+    """
+    previous = {record_key(record): record['seconds'] for record in baseline}
+
+    regressions = []
+    for record in current:
+        old = previous.get(record_key(record))
+        if old is None:
+            continue
+
+        if max(old, record['seconds']) < min_seconds:
+            continue
+
+        if record['seconds'] > old * (1 + threshold):
+            regressions.append((record, old))
+
+    return regressions
+
+def load_results(filename):
+    with open(filename, 'r') as f:
+        return json.load(f)['results']
+
+def save_results(filename, records, seed, repeat):
+    results = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'seed': seed,
+        'repeat': repeat,
+        'results': records,
+    }
+
+    with open(filename, 'w') as f:
+        json.dump(results, f, indent=2)
+        f.write('\n')
+
+def report_regressions(regressions, report=sys.stdout):
+    for (record, old) in regressions:
+        print("{} {:>10} {:<7} {:10.4f}s -> {:10.4f}s ({:+.0%})".format(
+            days.day_name(record['day']),
+            record['size'],
+            record['stage'],
+            old,
+            record['seconds'],
+            record['seconds'] / old - 1 if old else float('inf'),
+        ), file=report)
+
+def main_run(selected_days, output, repeat, seed, sizes, baseline, threshold):
+    """Benchmark the selected days, optionally comparing to a baseline"""
+    if not selected_days:
+        selected_days = [day for day in days.available_days()
+                         if generators.LADDERS.get(day)]
+
+    records = run_ladders(selected_days, repeat, seed, sizes)
+    save_results(output, records, seed, repeat)
+
+    if baseline is not None:
+        return main_compare(baseline, output, threshold)
+
+    return 0
+
+def main_compare(baseline, current, threshold):
+    """Report regressions of current results against the baseline"""
+    regressions = find_regressions(
+        load_results(baseline),
+        load_results(current),
+        threshold,
+    )
+    report_regressions(regressions)
+
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.required = True
+
+    run_parser = subparsers.add_parser('run', help='Benchmark the solutions')
+    run_parser.add_argument('selected_days', metavar='day', type=int, nargs='*',
+                            help='Days to benchmark (default: every day with a ladder)')
+    run_parser.add_argument('-o', '--output', default='bench_output.json')
+    run_parser.add_argument('--repeat', type=int, default=3)
+    run_parser.add_argument('--seed', type=int, default=generators.DEFAULT_SEED)
+    run_parser.add_argument('--sizes', type=int, nargs='+',
+                            help='Sizes to use instead of each day\'s ladder')
+    run_parser.add_argument('--baseline',
+                            help='Compare against these results when done')
+    run_parser.add_argument('--threshold', type=float, default=0.1,
+                            help='Slowdown (as a fraction) that counts as a regression')
+
+    compare_parser = subparsers.add_parser('compare', help='Compare two results')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=0.1,
+                                help='Slowdown (as a fraction) that counts as a regression')
+
+    args = vars(parser.parse_args())
+    command = args.pop('command')
+
+    if command == 'run':
+        sys.exit(main_run(**args))
+    else:
+        sys.exit(main_compare(**args))
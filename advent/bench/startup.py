@@ -0,0 +1,167 @@
+"""Check how long it takes to import each day's solution
+
+Short runs are dominated by interpreter startup, so heavy modules
+(numpy, multiprocessing) are only imported by the functions that need
+them. This imports each `code/NN/part_P.py` with `python3 -X
+importtime`, the way it is imported when run as a script, and fails
+if any of them imports a heavy module, or takes longer than a budget
+beyond the time taken to import `re` in the same run (so that the
+budget does not depend on how fast the machine is).
+
+Usage (from the top of the repository):
+
+    python3 -m advent.bench.startup [day ...] [--budget MS] [--repeat N]
+
+"""
+
+import os
+import subprocess
+import sys
+
+from advent import days
+
+# Import time allowed for a single part beyond importing `re`, in
+# milliseconds
+BUDGET_MS = 10.0
+
+# Modules that no part may import when it is imported
+HEAVY_MODULES = ('numpy', 'multiprocessing')
+
+# Imported to measure the baseline that the budget is added to
+BASELINE_MODULE = 're'
+
+def cumulative_import_time(output, name):
+    """Return the cumulative import time of a module in microseconds
+
+    `output` is what `python3 -X importtime` wrote to stderr.
+
+    >>> output = '''import time: self [us] | cumulative | imported package
+    ... import time:       120 |        120 |   re
+    ... import time:       400 |        520 | part_1
+    ... '''
+    >>> cumulative_import_time(output, 'part_1')
+    520
+    >>> cumulative_import_time(output, 'part_2')
+    Traceback (most recent call last):
+     ...
+    ValueError: part_2 was not imported
+
+    """
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+
+        fields = line[len('import time:'):].split('|')
+        if len(fields) == 3 and fields[2].strip() == name:
+            return int(fields[1])
+
+    raise ValueError('{} was not imported'.format(name))
+
+def heavy_imports(output):
+    """Return the heavy modules imported, in the order they were
+
+    >>> heavy_imports('''import time:       120 |        120 |   numpy.core
+    ... import time:       400 |        520 | numpy
+    ... import time:       400 |        400 | part_1
+    ... ''')
+    ['numpy']
+
+    """
+    imported = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+
+        name = line.split('|')[-1].strip()
+        if name in HEAVY_MODULES:
+            imported.append(name)
+
+    return imported
+
+def measure_import(name, cwd=None, python=sys.executable):
+    """Import a module in a fresh interpreter
+
+    Returns the time it took, in seconds, and the heavy modules it
+    imported.
+
+    >>> measure_import('multiprocessing.pool')[1]
+    ['multiprocessing']
+
+    """
+    process = subprocess.run(
+        [python, '-X', 'importtime', '-c', 'import {}'.format(name)],
+        cwd=cwd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+    seconds = cumulative_import_time(process.stderr, name) / 1e6
+
+    return (seconds, heavy_imports(process.stderr))
+
+def import_time(day, part, python=sys.executable):
+    """Return the time taken to import a part in a fresh interpreter,
+    and the heavy modules it imported
+
+    >>> (seconds, heavy) = import_time(1, 1)
+    >>> (0 < seconds < 1, heavy)
+    (True, [])
+
+    """
+    name = 'part_{}'.format(part)
+    cwd = os.path.dirname(days.code_path(day, part))
+
+    return measure_import(name, cwd, python)
+
+def main(selected_days, budget, repeat):
+    """Report the import time of each part, failing if over budget"""
+    if not selected_days:
+        selected_days = days.available_days()
+
+    baseline = min(measure_import(BASELINE_MODULE)[0] for _ in range(repeat))
+    limit = baseline * 1000 + budget
+    print("import {} {:8.1f}ms, allowing up to {:.1f}ms per part".format(
+        BASELINE_MODULE, baseline * 1000, limit))
+
+    failed = 0
+    for day in selected_days:
+        for part in sorted(days.load_day(day)):
+            measurements = [import_time(day, part) for _ in range(repeat)]
+            seconds = min(seconds for (seconds, _) in measurements)
+            heavy = measurements[0][1]
+
+            problems = []
+            if seconds * 1000 > limit:
+                problems.append('over budget')
+            if heavy:
+                problems.append('imports {}'.format(', '.join(heavy)))
+
+            failed += bool(problems)
+            print("{} part {} {:8.1f}ms{}".format(
+                days.day_name(day), part, seconds * 1000,
+                ''.join('  ' + problem for problem in problems)))
+
+    if failed:
+        print("{} part(s) over the budget of {}ms beyond {}, or importing "
+              "heavy modules".format(failed, budget, BASELINE_MODULE))
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('selected_days', metavar='day', type=int, nargs='*',
+                        help='Days to check (default: every day)')
+    parser.add_argument('--budget', type=float, default=BUDGET_MS,
+                        help='Import time allowed per part beyond importing '
+                             '{} in milliseconds (default: {})'.format(
+                                 BASELINE_MODULE, BUDGET_MS))
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Take the best of this many imports')
+    args = parser.parse_args()
+
+    sys.exit(main(**vars(args)))
@@ -0,0 +1,206 @@
+"""Cache parsed puzzle inputs and answers on disk
+
+Parsing an input with `part_1.parse` can cost more than solving it, and
+the same input is parsed again on every run. This module stores the
+parsed data under a key made from a hash of the input file's contents
+and a hash of the parser's source file, so editing either one
+invalidates the entry automatically.
+
+Answers are cached the same way by :class:`ResultCache`, under a key
+made from the input, the solver's source and the source of the
+`part_1` it imports, so a day is only solved again when one of those
+changes (and not, as with `make`, whenever a file is touched).
+
+Numpy arrays are stored with `numpy.save` and memory-mapped read-only
+when loaded; everything else is pickled. Pickled data refers to the
+classes of a day by the names :mod:`advent.days` imports them under,
+so the day must be loaded through :mod:`advent.days` before its cached
+data is read.
+
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+
+from advent import days
+from advent import inputs
+
+CACHE_DIR = os.path.join(days.ROOT_DIR, '.cache', 'parsed')
+RESULT_DIR = os.path.join(days.ROOT_DIR, '.cache', 'results')
+
+# Returned by ResultCache.get on a miss, since None is a valid answer
+MISSING = object()
+
+def file_digest(filename, chunk_size=1 << 20):
+    """Return the SHA-256 hex digest of a file's contents"""
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+def cache_key(filename, parser_module):
+    """Return the key for the parsed input of a file
+
+    >>> module = days.load_part(1, 1)
+    >>> key = cache_key(module.__file__, module)
+    >>> key == cache_key(module.__file__, module)
+    True
+    >>> len(key)
+    64
+
+    """
+    digest = hashlib.sha256()
+    digest.update(file_digest(filename).encode())
+    digest.update(file_digest(parser_module.__file__).encode())
+    digest.update('{}.{}'.format(*sys.version_info[:2]).encode())
+
+    return digest.hexdigest()
+
+def result_key(filename, solver_module, parser_module, other_modules=()):
+    """Return the key for the answer of a solver to a file
+
+    Modules in `other_modules` are also part of the key, for answers
+    that may be computed by code outside of the solver's module.
+
+    >>> (part_1, part_2) = (days.load_part(1, 1), days.load_part(1, 2))
+    >>> key = result_key(part_1.__file__, part_2, part_1)
+    >>> key == result_key(part_1.__file__, part_1, part_1)
+    False
+    >>> key == result_key(part_1.__file__, part_2, part_1, [part_2])
+    False
+    >>> len(key)
+    64
+
+    """
+    modules = [solver_module, parser_module] + list(other_modules)
+
+    digest = hashlib.sha256()
+    for path in [filename] + [module.__file__ for module in modules]:
+        digest.update(file_digest(path).encode())
+
+    return digest.hexdigest()
+
+def is_array(value):
+    """Check if a value is a numpy array, without importing numpy"""
+    numpy = sys.modules.get('numpy')
+    return numpy is not None and isinstance(value, numpy.ndarray)
+
+def write_atomically(path, write):
+    """Call `write(fileobj)` on a temporary file, then move it to `path`
+
+    Concurrent readers either see the old entry or the complete new one.
+
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+
+    (fd, temp_path) = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+def store(path, parsed):
+    """Store parsed data at `path` (without an extension)"""
+    if is_array(parsed):
+        import numpy as np
+        write_atomically(path + '.npy', lambda f: np.save(f, parsed))
+    else:
+        write_atomically(
+            path + '.pickle',
+            lambda f: pickle.dump(parsed, f, pickle.HIGHEST_PROTOCOL),
+        )
+
+def load(path):
+    """Return parsed data stored at `path`, or raise KeyError"""
+    if os.path.exists(path + '.npy'):
+        import numpy as np
+        return np.load(path + '.npy', mmap_mode='r')
+
+    if os.path.exists(path + '.pickle'):
+        with open(path + '.pickle', 'rb') as f:
+            return pickle.load(f)
+
+    raise KeyError(path)
+
+def load_parsed(parser_module, filename, cache_dir=CACHE_DIR):
+    """Return `parser_module.parse` of a file, using the cache if possible
+
+    >>> import tempfile
+    >>> module = days.load_part(1, 1)
+    >>> with tempfile.TemporaryDirectory() as cache_dir:
+    ...     first = load_parsed(module, module.__file__, cache_dir)
+    ...     second = load_parsed(module, module.__file__, cache_dir)
+    ...     len(os.listdir(cache_dir))
+    1
+    >>> first == second
+    True
+
+    """
+    path = os.path.join(cache_dir, cache_key(filename, parser_module))
+
+    try:
+        return load(path)
+    except KeyError:
+        pass
+    except Exception:
+        # A corrupt or stale entry (such as one referring to a class
+        # that no longer exists) is simply replaced.
+        pass
+
+    parsed = inputs.parse_file(parser_module, filename)
+
+    store(path, parsed)
+
+    return parsed
+
+class ResultCache(object):
+    """Answers stored on disk by key, counting hits and misses
+
+    >>> import tempfile
+    >>> with tempfile.TemporaryDirectory() as directory:
+    ...     results = ResultCache(directory)
+    ...     missing = results.get('key')
+    ...     results.put('key', None)
+    ...     (missing is MISSING, results.get('key'))
+    (True, None)
+    >>> results.summary()
+    'result cache: 1 hit, 1 miss'
+
+    """
+
+    def __init__(self, directory=RESULT_DIR):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Return the answer stored under a key, or MISSING on a miss"""
+        try:
+            answer = load(os.path.join(self.directory, key))
+        except Exception:
+            # Missing and unreadable entries are both misses; the
+            # answer is stored again once it has been computed.
+            self.misses += 1
+            return MISSING
+
+        self.hits += 1
+        return answer
+
+    def put(self, key, answer):
+        """Store the answer under a key"""
+        store(os.path.join(self.directory, key), answer)
+
+    def summary(self):
+        return "result cache: {} hit{}, {} miss{}".format(
+            self.hits, '' if self.hits == 1 else 's',
+            self.misses, '' if self.misses == 1 else 'es',
+        )
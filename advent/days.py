@@ -0,0 +1,136 @@
+"""Locate and import the solutions for each day
+
+The solutions are written as scripts: each `part_2` imports its
+sibling with a plain `import part_1`, relying on the script directory
+being on `sys.path`. To run many days in one interpreter, the parts
+are imported by path under unique names (`day01_part_1`, ...), and
+`part_1` is aliased to the right day while its `part_2` is imported.
+
+"""
+
+import contextlib
+import importlib.util
+import os
+import re
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CODE_DIR = os.path.join(ROOT_DIR, 'code')
+INPUT_DIR = os.path.join(ROOT_DIR, 'input')
+GEN_DIR = os.path.join(ROOT_DIR, 'gen')
+
+PARTS = (1, 2)
+
+def day_name(day):
+    """Return the zero-padded name used for a day's directories
+
+    >>> day_name(1)
+    '01'
+    >>> day_name('7')
+    '07'
+    >>> day_name('24')
+    '24'
+
+    """
+    return '{:02d}'.format(int(day))
+
+def module_name(day, part):
+    """Return the unique name a part is imported under
+
+    >>> module_name(3, 2)
+    'day03_part_2'
+
+    """
+    return 'day{}_part_{}'.format(day_name(day), part)
+
+def code_path(day, part):
+    """Return the path of the script solving a day/part"""
+    return os.path.join(CODE_DIR, day_name(day), 'part_{}.py'.format(part))
+
+def input_path(day, input_dir=INPUT_DIR):
+    """Return the path of the puzzle input for a day"""
+    return os.path.join(input_dir, day_name(day))
+
+def gen_path(day, part, gen_dir=GEN_DIR):
+    """Return the path the answer for a day/part is written to"""
+    return os.path.join(gen_dir, day_name(day), str(part))
+
+def available_days():
+    """Return every day that has a solution, in order
+
+    >>> available_days()[:3]
+    [1, 2, 3]
+
+    """
+    return sorted(
+        int(name)
+        for name in os.listdir(CODE_DIR)
+        if re.match(r'^\d\d$', name) and os.path.exists(code_path(name, 1))
+    )
+
+@contextlib.contextmanager
+def part_1_alias(day):
+    """Make `import part_1` import the first part of a day
+
+    >>> with part_1_alias(1):
+    ...     import part_1
+    >>> part_1 is load_part(1, 1)
+    True
+    >>> 'part_1' in sys.modules
+    False
+
+    """
+    previous_part_1 = sys.modules.get('part_1')
+    sys.modules['part_1'] = load_part(day, 1)
+    try:
+        yield
+    finally:
+        if previous_part_1 is None:
+            sys.modules.pop('part_1', None)
+        else:
+            sys.modules['part_1'] = previous_part_1
+
+def load_part(day, part):
+    """Import a single part of a day and return the module
+
+    Modules are cached in `sys.modules`, so loading the same part
+    again is cheap and returns the same module.
+
+    >>> load_part(1, 2).part_1 is load_part(1, 1)
+    True
+
+    """
+    name = module_name(day, part)
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.spec_from_file_location(name, code_path(day, part))
+    module = importlib.util.module_from_spec(spec)
+
+    sys.modules[name] = module
+    try:
+        if part == 1:
+            spec.loader.exec_module(module)
+        else:
+            # The other parts import `part_1` by name, so make sure it
+            # resolves to this day's module while they are executed.
+            with part_1_alias(day):
+                spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+
+    return module
+
+def load_day(day):
+    """Import every part of a day, returning a mapping of part to module
+
+    >>> sorted(load_day(1))
+    [1, 2]
+
+    """
+    return {
+        part: load_part(day, part)
+        for part in PARTS
+        if os.path.exists(code_path(day, part))
+    }
@@ -0,0 +1,213 @@
+"""Run the doctests of every day on a pool of interpreters
+
+Usage (from the top of the repository):
+
+    python3 -m advent.doctests [day ...] [-j N] [--skip-slow]
+
+This is the parallel equivalent of `make test/all`: every
+`code/NN/part_P.py` is imported once through :mod:`advent.days` and
+its doctests are run in a worker process. The time taken by each
+module is reported as it finishes, followed by the slowest examples.
+
+Expensive examples are tagged by ending their source line with a
+`# slow` comment, which plain `python3 -m doctest` ignores. With
+`--skip-slow`, a tagged example is skipped along with the examples
+after it in the same docstring, since those usually depend on it.
+
+"""
+
+import concurrent.futures
+import doctest
+import os
+import re
+import sys
+import time
+
+from advent import days
+
+SLOW_PATTERN = re.compile(r'#\s*slow\s*$', re.MULTILINE)
+
+def is_slow(example):
+    """Check if an example is tagged as slow
+
+    >>> is_slow(doctest.Example('finder.find_solution(609000)  # slow', ''))
+    True
+    >>> is_slow(doctest.Example('finder.find_solution(609000)', ''))
+    False
+
+    """
+    return SLOW_PATTERN.search(example.source) is not None
+
+def skip_slow_examples(test):
+    """Skip each slow example of a test and every example after it
+
+    Returns the number of examples that will be skipped.
+
+    >>> parser = doctest.DocTestParser()
+    >>> test = parser.get_doctest(
+    ...     '>>> x = 1\\n>>> x += 1  # slow\\n>>> x\\n2\\n', {}, 'x', None, 0)
+    >>> skip_slow_examples(test)
+    2
+
+    """
+    skipped = 0
+    skipping = False
+    for example in test.examples:
+        skipping = skipping or is_slow(example)
+        if skipping:
+            example.options[doctest.SKIP] = True
+            skipped += 1
+
+    return skipped
+
+class TimingRunner(doctest.DocTestRunner):
+    """A doctest runner that records how long each example takes"""
+
+    def __init__(self, *args, **kwargs):
+        doctest.DocTestRunner.__init__(self, *args, **kwargs)
+        self.timings = []
+        self.start = None
+
+    def report_start(self, out, test, example):
+        self.start = time.perf_counter()
+        doctest.DocTestRunner.report_start(self, out, test, example)
+
+    def record(self, test, example):
+        lineno = (test.lineno or 0) + example.lineno + 1
+        self.timings.append((
+            time.perf_counter() - self.start,
+            lineno,
+            example.source.strip(),
+        ))
+
+    def report_success(self, out, test, example, got):
+        self.record(test, example)
+        doctest.DocTestRunner.report_success(self, out, test, example, got)
+
+    def report_failure(self, out, test, example, got):
+        self.record(test, example)
+        doctest.DocTestRunner.report_failure(self, out, test, example, got)
+
+    def report_unexpected_exception(self, out, test, example, exc_info):
+        self.record(test, example)
+        doctest.DocTestRunner.report_unexpected_exception(
+            self, out, test, example, exc_info)
+
+def test_part(day, part, skip_slow=False):
+    """Run the doctests of a single part and return a summary
+
+    The summary holds the number of examples attempted, failed and
+    skipped, the failure report, the total time, and the
+    (seconds, line number, source) of each example that was run.
+
+    >>> summary = test_part(1, 1)
+    >>> (summary['failed'], summary['attempted'] > 0)
+    (0, True)
+
+    """
+    start = time.perf_counter()
+
+    module = days.load_part(day, part)
+    finder = doctest.DocTestFinder()
+    runner = TimingRunner(verbose=False)
+
+    output = []
+    skipped = 0
+    with days.part_1_alias(day):
+        # Some examples import `part_1`, as they would when the
+        # script is tested on its own.
+        for test in finder.find(module):
+            if skip_slow:
+                skipped += skip_slow_examples(test)
+            runner.run(test, out=output.append)
+
+    return {
+        'day': day,
+        'part': part,
+        'attempted': runner.tries,
+        'failed': runner.failures,
+        'skipped': skipped,
+        'output': ''.join(output),
+        'seconds': time.perf_counter() - start,
+        'examples': runner.timings,
+    }
+
+def script_name(day, part):
+    """Return the path of a part relative to the top of the repository
+
+    >>> script_name(4, 1)
+    'code/04/part_1.py'
+
+    """
+    return os.path.relpath(days.code_path(day, part), days.ROOT_DIR)
+
+def test_parts(selected_days, skip_slow=False, workers=None):
+    """Yield the summary of each part's doctests as they finish"""
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(test_part, day, part, skip_slow)
+            for day in selected_days
+            for part in days.load_day(day)
+        ]
+
+        for future in concurrent.futures.as_completed(futures):
+            yield future.result()
+
+def main(selected_days, workers, skip_slow, slowest):
+    """Run the doctests of the selected days (default: all of them)"""
+    if not selected_days:
+        selected_days = days.available_days()
+
+    start = time.perf_counter()
+
+    summaries = []
+    for summary in test_parts(selected_days, skip_slow, workers):
+        summaries.append(summary)
+        sys.stdout.write(summary['output'])
+        print("{:<18} {:8.3f}s  {} passed, {} failed, {} skipped".format(
+            script_name(summary['day'], summary['part']),
+            summary['seconds'],
+            summary['attempted'] - summary['failed'],
+            summary['failed'],
+            summary['skipped'],
+        ), flush=True)
+
+    examples = sorted(
+        (
+            (seconds, script_name(summary['day'], summary['part']), lineno, source)
+            for summary in summaries
+            for (seconds, lineno, source) in summary['examples']
+        ),
+        reverse=True,
+    )
+    if slowest and examples:
+        print("\nslowest examples:")
+        for (seconds, name, lineno, source) in examples[:slowest]:
+            print("{:8.3f}s  {}:{}  {}".format(
+                seconds, name, lineno, source.splitlines()[0]))
+
+    failed = sum(summary['failed'] for summary in summaries)
+    print("\ntotal {:8.3f}s  {} passed, {} failed, {} skipped".format(
+        time.perf_counter() - start,
+        sum(summary['attempted'] for summary in summaries) - failed,
+        failed,
+        sum(summary['skipped'] for summary in summaries),
+    ))
+
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('selected_days', metavar='day', type=int, nargs='*',
+                        help='Days to test (default: every day)')
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help='Number of worker processes (default: cpu count)')
+    parser.add_argument('--skip-slow', action='store_true',
+                        help='Skip the examples tagged with a "# slow" comment')
+    parser.add_argument('--slowest', type=int, default=10, metavar='N',
+                        help='Report the N slowest examples (default: 10)')
+    args = parser.parse_args()
+
+    sys.exit(main(**vars(args)))
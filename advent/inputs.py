@@ -0,0 +1,62 @@
+"""Parse puzzle inputs, through a memory map where a day reads bytes
+
+Every solution's `parse` takes a text file object, which
+:func:`parse_file` opens with plain `open`. A day whose parsed input
+is made straight from the raw bytes (days 1, 2 and 3) can also define
+`parse_bytes`, which :func:`parse_file` passes the file mapped
+read-only with :func:`map_file` instead, so the input is never decoded.
+
+The map is closed as soon as `parse_bytes` returns, so what it returns
+must not refer to the mapped bytes.
+
+"""
+
+import contextlib
+import mmap
+
+@contextlib.contextmanager
+def map_file(filename):
+    """Map a file read-only, yielding a bytes-like object
+
+    The object supports `len`, `find`, slicing and the buffer
+    protocol, and must not be used after the block exits.
+
+    >>> import tempfile
+    >>> with tempfile.NamedTemporaryFile() as f:
+    ...     _ = f.write(b'((()')
+    ...     f.flush()
+    ...     with map_file(f.name) as data:
+    ...         (len(data), data.find(b')'), data[:2])
+    (4, 3, b'((')
+
+    """
+    with open(filename, 'rb') as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            yield b''
+            return
+
+        try:
+            yield data
+        finally:
+            data.close()
+
+def parse_file(parser_module, filename):
+    """Return the parsed input of a file, using the module's parser
+
+    >>> from advent import days
+    >>> parse_file(days.load_part(1, 1), days.code_path(1, 1))[:3]
+    b'#!/'
+    >>> parse_file(days.load_part(5, 1), days.code_path(5, 1))[0]
+    '#!/usr/bin/env python3\\n'
+
+    """
+    parse_bytes = getattr(parser_module, 'parse_bytes', None)
+    if parse_bytes is not None:
+        with map_file(filename) as data:
+            return parse_bytes(data)
+
+    with open(filename, 'r') as f:
+        return parser_module.parse(f)
@@ -0,0 +1,285 @@
+"""Profile a single day/part, split into parse, solve and print
+
+Takes the same arguments as the script it profiles, followed by the
+profiler's own options:
+
+    python3 -m advent.profiling code/06/part_1.py input/06 --timings
+    python3 -m advent.profiling code/03/part_2.py input/03 \\
+        --num-agents 3 --profile 03-2.pstats --memory --json
+
+The script's own argument parsing and `main` are run, so the input is
+read and the answer printed exactly as when the script is run by
+itself. Its `parse`, `solve` (or `solve_both`) and `print` are timed
+as separate stages. Parsers read from the open input file, so the
+parse stage includes reading it, and whatever else `main` does is
+counted as 'other'.
+
+`--timings` reports the wall time of each stage on stderr, `--json`
+reports them (and the other measurements) as a single JSON object
+instead, for collection by other jobs. `--profile` dumps cProfile
+statistics for `pstats`, and `--memory` reports the peak memory
+allocated through Python, as measured by `tracemalloc`.
+
+"""
+
+import ast
+import contextlib
+import cProfile
+import functools
+import json
+import os
+import re
+import sys
+import time
+import tracemalloc
+
+from advent import days
+
+# The stage that each function called by a script's `main` counts in
+STAGE_FUNCTIONS = {
+    'parse': 'parse',
+    'solve': 'solve',
+    'solve_both': 'solve',
+    'print': 'print',
+}
+
+class StageTimer(object):
+    """Accumulate the wall time spent in named stages
+
+    A stage entered while another is running (such as a `solve` that
+    prints) counts as part of the outer stage.
+
+    >>> timer = StageTimer()
+    >>> with timer.stage('parse'):
+    ...     with timer.stage('print'):
+    ...         pass
+    >>> with timer.stage('solve'):
+    ...     pass
+    >>> list(timer.timings)
+    ['parse', 'solve']
+    >>> timer.total() >= 0
+    True
+
+    """
+    def __init__(self):
+        self.timings = {}
+        self.running = False
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        if self.running:
+            yield
+            return
+
+        self.running = True
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.timings[name] = self.timings.get(name, 0.0) + elapsed
+            self.running = False
+
+    def timed(self, name, function):
+        """Wrap a function so that its calls count in a stage"""
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with self.stage(name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    def total(self):
+        return sum(self.timings.values())
+
+def parse_script_path(path):
+    """Return the (day, part) solved by a script
+
+    >>> parse_script_path('code/06/part_1.py')
+    (6, 1)
+    >>> parse_script_path('README.md')
+    Traceback (most recent call last):
+     ...
+    ValueError: Not a solution script: 'README.md'
+
+    """
+    match = re.search(r'(\d\d)[/\\]part_(\d)\.py$', path)
+    if not match:
+        raise ValueError("Not a solution script: '{}'".format(path))
+
+    (day, part) = match.groups()
+
+    return (int(day), int(part))
+
+def main_block(path):
+    """Compile the body of a script's `if __name__ == "__main__":` block
+
+    >>> code = main_block(days.code_path(3, 2))
+    >>> 'parse_args' in code.co_names
+    True
+
+    """
+    with open(path, 'r') as f:
+        tree = ast.parse(f.read(), path)
+
+    for node in tree.body:
+        if (isinstance(node, ast.If)
+                and isinstance(node.test, ast.Compare)
+                and isinstance(node.test.left, ast.Name)
+                and node.test.left.id == '__name__'):
+            return compile(ast.Module(node.body, []), path, 'exec')
+
+    raise ValueError("No main block in '{}'".format(path))
+
+@contextlib.contextmanager
+def timed_functions(modules, timer):
+    """Count calls to the stage functions of some modules in `timer`
+
+    Every module gets a timed `print`, which is found before the
+    builtin one. The original functions are restored afterwards.
+
+    """
+    missing = object()
+    replaced = []
+    for module in modules:
+        namespace = vars(module)
+        for (name, stage) in STAGE_FUNCTIONS.items():
+            function = namespace.get(name, print if name == 'print' else None)
+            if function is None:
+                continue
+
+            replaced.append((namespace, name, namespace.get(name, missing)))
+            namespace[name] = timer.timed(stage, function)
+
+    try:
+        yield
+    finally:
+        for (namespace, name, original) in reversed(replaced):
+            if original is missing:
+                del namespace[name]
+            else:
+                namespace[name] = original
+
+def profile_part(day, part, filename, script_args=(), profile_path=None,
+                 memory=False):
+    """Run a day/part's `main`, measuring each stage
+
+    `script_args` are the script's options besides the input file.
+    Returns a dict with the time of each stage, and the peak memory if
+    `memory` is set. Importing the solution is not measured.
+
+    >>> import tempfile
+    >>> with tempfile.NamedTemporaryFile('w') as f:
+    ...     _ = f.write('^v^v^v^v^v')
+    ...     f.flush()
+    ...     result = profile_part(3, 2, f.name, ['--num-agents', '1'])
+    2
+    >>> list(result['stages'])
+    ['parse', 'solve', 'print', 'other']
+
+    """
+    module = days.load_part(day, part)
+    code = main_block(days.code_path(day, part))
+
+    modules = [module]
+    if part != 1:
+        modules.append(days.load_part(day, 1))
+
+    timer = StageTimer()
+    profiler = cProfile.Profile() if profile_path else None
+
+    previous_argv = sys.argv
+    sys.argv = [days.code_path(day, part), filename] + list(script_args)
+
+    if memory:
+        tracemalloc.start()
+    if profiler:
+        profiler.enable()
+
+    start = time.perf_counter()
+    try:
+        with timed_functions(modules, timer):
+            exec(code, vars(module))
+    finally:
+        elapsed = time.perf_counter() - start
+        if profiler:
+            profiler.disable()
+        if memory:
+            (_, peak_memory) = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        sys.argv = previous_argv
+
+    timer.timings['other'] = max(elapsed - timer.total(), 0.0)
+
+    result = {
+        'day': day,
+        'part': part,
+        'input': os.path.abspath(filename),
+        'args': list(script_args),
+        'stages': timer.timings,
+        'total': timer.total(),
+    }
+
+    if memory:
+        result['peak_memory'] = peak_memory
+
+    if profiler:
+        profiler.dump_stats(profile_path)
+        result['profile'] = os.path.abspath(profile_path)
+
+    return result
+
+def format_result(result):
+    """Return a human-readable report of :func:`profile_part`
+
+    >>> print(format_result({'stages': {'parse': 0.5, 'solve': 1.0},
+    ...                      'total': 1.5, 'peak_memory': 2048}))
+    parse        0.500000s
+    solve        1.000000s
+    total        1.500000s
+    peak memory       2048 bytes
+
+    """
+    lines = [
+        '{:<8} {:>12.6f}s'.format(stage, seconds)
+        for (stage, seconds) in result['stages'].items()
+    ]
+    lines.append('{:<8} {:>12.6f}s'.format('total', result['total']))
+
+    if 'peak_memory' in result:
+        lines.append('peak memory {:>10} bytes'.format(result['peak_memory']))
+
+    if 'profile' in result:
+        lines.append('profile  {}'.format(result['profile']))
+
+    return '\n'.join(lines)
+
+def main(script, filename, script_args, timings, profile, memory, json_output):
+    """Solve a day/part and report how long each stage took"""
+    (day, part) = parse_script_path(script)
+
+    result = profile_part(day, part, filename, script_args, profile, memory)
+
+    if json_output:
+        print(json.dumps(result, sort_keys=True), file=sys.stderr)
+    elif timings or profile or memory:
+        print(format_result(result), file=sys.stderr)
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        epilog='Any other options are passed on to the script.')
+    parser.add_argument('script', help='Solution to run, e.g. code/06/part_1.py')
+    parser.add_argument('filename')
+    parser.add_argument('--timings', action='store_true',
+                        help='Report the time of each stage on stderr')
+    parser.add_argument('--profile', metavar='PSTATS',
+                        help='Dump cProfile statistics to this file')
+    parser.add_argument('--memory', action='store_true',
+                        help='Report the peak memory allocated by Python')
+    parser.add_argument('--json', dest='json_output', action='store_true',
+                        help='Report as a JSON object on stderr')
+    (args, script_args) = parser.parse_known_args()
+
+    main(script_args=script_args, **vars(args))
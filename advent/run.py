@@ -0,0 +1,258 @@
+"""Solve every day/part in a single interpreter
+
+This is the in-process equivalent of `make gen/all`: each day's input
+is parsed once with `part_1.parse` (or loaded from the parsed-input
+cache, see :mod:`advent.cache`), every part's `solve` is called on the
+result, and the answers are written to the same `gen/NN/P` files the
+Makefile produces. Days whose `part_2` has a `solve_both` solve both
+parts in one call, sharing the work they have in common. The wall time
+of each stage is reported on stderr.
+
+Answers are also cached by the content of the input and the solver
+(see :class:`advent.cache.ResultCache`): a part whose answer is cached
+is not solved again, and a day whose parts are all cached is not even
+parsed. The number of hits and misses is reported at the end.
+
+Usage (from the top of the repository):
+
+    python3 -m advent.run            # every day
+    python3 -m advent.run 1 7 18     # only some days
+
+To look at a single part in more detail (stage timings, cProfile
+output and peak memory), see :mod:`advent.profiling`.
+
+"""
+
+import json
+import os
+import sys
+import time
+
+from advent import cache
+from advent import days
+from advent import inputs
+
+def format_answer(answer):
+    """Return the text `main` would print for an answer
+
+    Most answers are a single value, but a few days have several
+    answers that are printed one per line.
+
+    >>> format_answer(42)
+    '42\\n'
+    >>> format_answer([1, 2])
+    '1\\n2\\n'
+
+    """
+    if isinstance(answer, (list, tuple)):
+        return ''.join('{}\n'.format(x) for x in answer)
+
+    return '{}\n'.format(answer)
+
+def write_answer(path, answer):
+    """Write an answer to a file, creating its directory if needed"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(format_answer(answer))
+
+def solve_day(day, filename, parts=days.PARTS, cache_dir=None, share=True):
+    """Parse the input of a day once and solve each part
+
+    Yields a (stage, elapsed, answer) tuple for the parse stage
+    (with an answer of None) and for each part that was solved. The
+    parsed input is cached in `cache_dir`, unless it is None.
+
+    When every part is wanted and the day has a `solve_both` (in its
+    last part), both parts are solved together so that they can share
+    their intermediate work. This is yielded as a single stage named
+    'both', whose answer is the tuple of answers, unless `share` is
+    False.
+
+    """
+    modules = days.load_day(day)
+
+    start = time.perf_counter()
+    if cache_dir is None:
+        parsed = inputs.parse_file(modules[1], filename)
+    else:
+        parsed = cache.load_parsed(modules[1], filename, cache_dir)
+    yield ('parse', time.perf_counter() - start, None)
+
+    solve_both = getattr(modules[max(modules)], 'solve_both', None)
+    if share and solve_both is not None and all(part in parts for part in modules):
+        start = time.perf_counter()
+        answers = solve_both(parsed)
+        yield ('both', time.perf_counter() - start, answers)
+        return
+
+    for part, module in sorted(modules.items()):
+        if part not in parts:
+            continue
+
+        start = time.perf_counter()
+        answer = module.solve(parsed)
+        yield (part, time.perf_counter() - start, answer)
+
+def lookup_answers(day, filename, parts, results):
+    """Return the keys of the parts of a day and their cached answers
+
+    Returns two dicts mapping each part to its key in `results` and
+    to its cached answer, respectively. Parts that are not cached are
+    missing from the second one.
+
+    When the day has a `solve_both`, the answers of every part may come
+    from it, so its module is part of the key of every part.
+
+    >>> filename = days.code_path(10, 1)
+    >>> part_1 = days.load_part(10, 1)
+    >>> keys = lookup_answers(10, filename, (1, 2), {})[0]
+    >>> keys[1] == cache.result_key(filename, part_1, part_1)
+    False
+
+    """
+    modules = days.load_day(day)
+
+    last = modules[max(modules)]
+    if hasattr(last, 'solve_both'):
+        shared = [last]
+    else:
+        shared = []
+
+    keys = {}
+    answers = {}
+    for part in parts:
+        if part not in modules:
+            continue
+
+        other_modules = [module for module in shared if module is not modules[part]]
+        keys[part] = cache.result_key(filename, modules[part], modules[1], other_modules)
+        answer = results.get(keys[part])
+        if answer is not cache.MISSING:
+            answers[part] = answer
+
+    return (keys, answers)
+
+def stage_answers(stage, answer):
+    """Return the answer of each part solved by a stage of `solve_day`
+
+    >>> stage_answers('parse', None)
+    {}
+    >>> stage_answers(2, 42)
+    {2: 42}
+    >>> stage_answers('both', (42, 7))
+    {1: 42, 2: 7}
+
+    """
+    if stage == 'parse':
+        return {}
+
+    if stage == 'both':
+        return dict(zip(days.PARTS, answer))
+
+    return {stage: answer}
+
+def run(selected_days, input_dir, gen_dir, parts=days.PARTS, cache_dir=None,
+        results=None, share=True, report=sys.stderr):
+    """Solve the selected days and write each answer to `gen_dir`
+
+    Answers found in `results` (a :class:`advent.cache.ResultCache`,
+    or None to always solve) are written without solving the part.
+    Both parts of a day are solved together when possible, unless
+    `share` is False. Returns a record of the time taken by each
+    stage of each day.
+
+    """
+    records = []
+    total = 0.0
+    for day in selected_days:
+        filename = days.input_path(day, input_dir)
+        if not os.path.exists(filename):
+            print("{} missing input {}".format(days.day_name(day), filename),
+                  file=report)
+            continue
+
+        if results is None:
+            (keys, cached) = ({}, {})
+        else:
+            (keys, cached) = lookup_answers(day, filename, parts, results)
+
+        for (part, answer) in sorted(cached.items()):
+            write_answer(days.gen_path(day, part, gen_dir), answer)
+            print("{} part {}     cached".format(days.day_name(day), part),
+                  file=report)
+            records.append({'day': day, 'stage': 'part {}'.format(part),
+                            'seconds': 0.0, 'cached': True})
+
+        remaining = tuple(part for part in parts if part not in cached)
+        if results is not None and not any(part in keys for part in remaining):
+            # Every part was cached, so there is no need to parse
+            continue
+
+        stages = solve_day(day, filename, remaining, cache_dir, share)
+        for (stage, elapsed, answer) in stages:
+            total += elapsed
+            if stage in ('parse', 'both'):
+                label = stage
+            else:
+                label = 'part {}'.format(stage)
+
+            for (part, part_answer) in stage_answers(stage, answer).items():
+                write_answer(days.gen_path(day, part, gen_dir), part_answer)
+                if part in keys:
+                    results.put(keys[part], part_answer)
+
+            print("{} {:<7} {:10.3f}s".format(days.day_name(day), label, elapsed),
+                  file=report)
+            records.append({'day': day, 'stage': label, 'seconds': elapsed})
+
+    print("total      {:10.3f}s".format(total), file=report)
+    if results is not None:
+        print(results.summary(), file=report)
+
+    return records
+
+def main(selected_days, input_dir, gen_dir, parts, cache_dir, no_cache,
+         result_dir, no_result_cache, separate, json_output):
+    """Solve the selected days (default: all of them)"""
+    if not selected_days:
+        selected_days = days.available_days()
+
+    if no_cache:
+        cache_dir = None
+
+    results = None if no_result_cache else cache.ResultCache(result_dir)
+
+    records = run(selected_days, input_dir, gen_dir, tuple(parts), cache_dir,
+                  results, share=not separate)
+
+    if json_output is not None:
+        with open(json_output, 'w') as f:
+            json.dump({'results': records}, f, indent=2)
+            f.write('\n')
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('selected_days', metavar='day', type=int, nargs='*',
+                        help='Days to solve (default: every day)')
+    parser.add_argument('--input-dir', default=days.INPUT_DIR)
+    parser.add_argument('--gen-dir', default=days.GEN_DIR)
+    parser.add_argument('--parts', type=int, nargs='+', default=list(days.PARTS),
+                        choices=days.PARTS)
+    parser.add_argument('--cache-dir', default=cache.CACHE_DIR,
+                        help='Where to cache parsed inputs')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always parse the inputs')
+    parser.add_argument('--result-dir', default=cache.RESULT_DIR,
+                        help='Where to cache answers')
+    parser.add_argument('--no-result-cache', action='store_true',
+                        help='Always solve every part')
+    parser.add_argument('--separate', action='store_true',
+                        help='Solve each part on its own, even if the day '
+                             'can solve both parts together')
+    parser.add_argument('--json', dest='json_output', metavar='FILE',
+                        help='Also write the timings as JSON to this file')
+    args = parser.parse_args()
+
+    main(**vars(args))
@@ -41,6 +41,9 @@ To what floor do the instructions take Santa?
 
 """
 
+# Number of instructions handled at a time by the bytes engine
+CHUNK_SIZE = 1 << 20
+
 def current_floor(instructions):
     """Yield the current floor based on the instructions
 
@@ -60,29 +63,170 @@ def current_floor(instructions):
             floor -= 1
         yield floor
 
+def instruction_chunks(instructions, chunk_size=CHUNK_SIZE):
+    """Yield successive chunks of the instructions as bytes
+
+    The instructions can be a string or any bytes-like object, such as
+    a memory-mapped file. Only one chunk is copied at a time.
+
+    >>> list(instruction_chunks("(()))", 2))
+    [b'((', b'))', b')']
+    >>> list(instruction_chunks(b"(()", 2))
+    [b'((', b')']
+
+    """
+    if isinstance(instructions, str):
+        for start in range(0, len(instructions), chunk_size):
+            yield instructions[start:start+chunk_size].encode('ascii')
+        return
+
+    with memoryview(instructions) as view:
+        for start in range(0, len(view), chunk_size):
+            yield view[start:start+chunk_size].tobytes()
+
 def final_floor(instructions):
     """Return the final floor based on the instructions
 
+    The instructions are counted a chunk of bytes at a time, rather
+    than followed one by one.
+
     >>> final_floor("(((")
     3
     >>> final_floor("())(()")
     0
     >>> final_floor("")
     0
+    >>> final_floor(b"))(")
+    -1
 
     """
     floor = 0
-    for floor in current_floor(instructions):
-        pass
+    for chunk in instruction_chunks(instructions):
+        floor += chunk.count(b'(') - chunk.count(b')')
 
     return floor
 
+def floor_changes(chunk):
+    """Return the floor after each instruction of a chunk of bytes,
+    relative to the floor the chunk starts on
+
+    >>> floor_changes(b"(()))(").tolist()
+    [1, 2, 1, 0, -1, 0]
+
+    """
+    import numpy as np
+
+    steps = np.frombuffer(chunk, dtype=np.uint8)
+    changes = (steps == ord('(')).astype(np.int8) - (steps == ord(')'))
+
+    return np.cumsum(changes, dtype=np.int64)
+
+def first_basement_in_chunk(chunk, floor):
+    """Return the position in a chunk where Santa first enters the
+    basement, starting on the given floor, or None
+
+    >>> first_basement_in_chunk(b"())", 0)
+    3
+    >>> first_basement_in_chunk(b"())", 1) is None
+    True
+
+    """
+    import numpy as np
+
+    # The floor changes by one at a time, starting above the basement,
+    # so the first floor below 0 is -1.
+    in_basement = floor + floor_changes(chunk) < 0
+    if not in_basement.any():
+        return None
+
+    return int(np.argmax(in_basement)) + 1
+
+class FloorTracker(object):
+    """Follow instructions that arrive a chunk at a time
+
+    Chunks can be strings or bytes of any size, and only the current
+    chunk is ever held. At any point, `floor` is the current floor,
+    `steps` the number of instructions followed and `first_basement`
+    the position where Santa first entered the basement (or None).
+    Looking for the basement is skipped unless `find_basement` is true.
+
+    >>> tracker = FloorTracker()
+    >>> tracker.feed("(()")
+    >>> (tracker.floor, tracker.steps, tracker.first_basement)
+    (1, 3, None)
+    >>> tracker.feed(b"))")
+    >>> tracker.feed("(")
+    >>> (tracker.floor, tracker.steps, tracker.first_basement)
+    (0, 6, 5)
+    >>> tracker = FloorTracker(find_basement=False)
+    >>> tracker.feed("())")
+    >>> (tracker.floor, tracker.first_basement)
+    (-1, None)
+
+    """
+    def __init__(self, find_basement=True):
+        self.floor = 0
+        self.steps = 0
+        self.first_basement = None
+        self.find_basement = find_basement
+
+    def feed(self, chunk):
+        """Follow the instructions in a chunk"""
+        if isinstance(chunk, str):
+            chunk = chunk.encode('ascii')
+        else:
+            chunk = bytes(chunk)
+
+        ups = chunk.count(b'(')
+        downs = chunk.count(b')')
+
+        # Only a chunk with enough ')' to reach the basement needs to
+        # be followed one instruction at a time.
+        if (self.find_basement and self.first_basement is None
+                and self.floor - downs < 0):
+            basement = first_basement_in_chunk(chunk, self.floor)
+            if basement is not None:
+                self.first_basement = self.steps + basement
+
+        self.floor += ups - downs
+        self.steps += len(chunk)
+
+    def read_from(self, fileobj, chunk_size=CHUNK_SIZE):
+        """Follow every instruction read from a file, pipe or socket
+
+        >>> import io
+        >>> tracker = FloorTracker()
+        >>> tracker.read_from(io.BytesIO(b"()())"), chunk_size=2)
+        >>> (tracker.floor, tracker.first_basement)
+        (-1, 5)
+
+        """
+        while True:
+            chunk = fileobj.read(chunk_size)
+            if not chunk:
+                break
+
+            self.feed(chunk)
+
+def parse(fileobj):
+    """Return the instructions contained in the input file"""
+    return fileobj.read()
+
+def parse_bytes(data):
+    """Return the instructions contained in the raw bytes of the input"""
+    return bytes(data)
+
+def solve(instructions):
+    """Return the floor that Santa ends at"""
+    return final_floor(instructions)
+
 def main(filename):
     """Print the final floor that Santa ends at"""
-    with open(filename, 'r') as f:
-        instructions = f.read()
+    tracker = FloorTracker(find_basement=False)
+    with open(filename, 'rb') as f:
+        tracker.read_from(f)
 
-    print(final_floor(instructions))
+    print(tracker.floor)
 
 if __name__ == "__main__":
     import argparse
@@ -32,11 +32,22 @@ the basement?
 
 """
 
+import functools
+
 import part_1
 
-def position_of_first_basement(instructions):
+# Number of instructions summarized by each task in parallel mode
+RANGE_SIZE = 16 * part_1.CHUNK_SIZE
+
+def position_of_first_basement(instructions, chunk_size=part_1.CHUNK_SIZE,
+                               floor=0):
     """Find the position where Santa first enters the basement
 
+    The instructions (a string or bytes) are scanned a chunk at a time,
+    starting on the given floor. A chunk is only looked at instruction
+    by instruction, with numpy, if it has enough ')' to reach the
+    basement, and the scan stops at the first chunk that does.
+
     >>> position_of_first_basement(")")
     1
     >>> position_of_first_basement("()())")
@@ -45,21 +56,125 @@ def position_of_first_basement(instructions):
     True
     >>> position_of_first_basement("") is None
     True
+    >>> position_of_first_basement(b"((()))()))", chunk_size=4)
+    9
+    >>> position_of_first_basement(b"())", floor=1) is None
+    True
 
     """
-    current_floor_iter = part_1.current_floor(instructions)
-    for position, floor in enumerate(current_floor_iter, start=1):
-        if floor == -1:
-            return position
-    else:
-        return None
+    position = 0
+    for chunk in part_1.instruction_chunks(instructions, chunk_size):
+        ups = chunk.count(b'(')
+        downs = chunk.count(b')')
 
-def main(filename):
-    """Print the first position where Santa goes to the basement"""
-    with open(filename, 'r') as f:
-        instructions = f.read()
+        if floor - downs <= -1:
+            basement = part_1.first_basement_in_chunk(chunk, floor)
+            if basement is not None:
+                return position + basement
+
+        floor += ups - downs
+        position += len(chunk)
+
+    return None
+
+def summarize_chunk(chunk):
+    """Return the (net change of floor, lowest floor) of a chunk, relative
+    to the floor it starts on
+
+    >>> summarize_chunk(b"(()))(")
+    (0, -1)
+    >>> summarize_chunk(b"((")
+    (2, 0)
+
+    """
+    if not chunk:
+        return (0, 0)
+
+    floors = part_1.floor_changes(chunk)
+
+    return (int(floors[-1]), min(0, int(floors.min())))
+
+def summarize_range(filename, byte_range, chunk_size=part_1.CHUNK_SIZE):
+    """Summarize the instructions in a range of bytes of a file
+
+    Summaries of consecutive chunks combine: the lowest floor of the
+    pair is the lower of the first's, and the first's change plus the
+    second's lowest floor.
+
+    """
+    import mmap
+
+    (start, end) = byte_range
+
+    delta = 0
+    lowest = 0
+    with open(filename, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for chunk_start in range(start, end, chunk_size):
+                chunk = data[chunk_start:min(chunk_start + chunk_size, end)]
+                (chunk_delta, chunk_lowest) = summarize_chunk(chunk)
+
+                lowest = min(lowest, delta + chunk_lowest)
+                delta += chunk_delta
+
+    return (delta, lowest)
+
+def position_of_first_basement_in_file(filename, num_processes,
+                                       range_size=RANGE_SIZE):
+    """Find the position where Santa first enters the basement, using
+    several processes on a (memory-mapped) file of instructions
+
+    The file is split into ranges that are summarized in parallel by
+    their net change of floor and lowest floor. Walking the summaries
+    in order gives the floor each range starts on, so only the first
+    range that reaches the basement is scanned instruction by
+    instruction.
+
+    """
+    import mmap
+    import multiprocessing
+    import os
 
-    position = position_of_first_basement(instructions)
+    size = os.path.getsize(filename)
+    ranges = [
+        (start, min(start + range_size, size))
+        for start in range(0, size, range_size)
+    ]
+
+    with multiprocessing.Pool(num_processes) as pool:
+        summaries = pool.imap(functools.partial(summarize_range, filename), ranges)
+
+        floor = 0
+        for ((start, end), (delta, lowest)) in zip(ranges, summaries):
+            if floor + lowest < 0:
+                break
+
+            floor += delta
+        else:
+            return None
+
+    with open(filename, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return start + position_of_first_basement(data[start:end], floor=floor)
+
+def solve(instructions):
+    """Return the first position where Santa goes to the basement"""
+    return position_of_first_basement(instructions)
+
+def main(filename, num_processes):
+    """Print the first position where Santa goes to the basement"""
+    import mmap
+    import os
+
+    if num_processes > 1:
+        position = position_of_first_basement_in_file(filename, num_processes)
+    elif os.path.getsize(filename) == 0:
+        # Empty files cannot be mapped
+        position = None
+    else:
+        with open(filename, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                position = position_of_first_basement(data)
 
     print(position)
 
@@ -68,6 +183,8 @@ if __name__ == "__main__":
 
     parser = argparse.ArgumentParser()
     parser.add_argument('filename')
+    parser.add_argument('--num-processes', type=int, default=1,
+                        help='Number of processes to scan the file with')
     args = parser.parse_args()
 
     main(**vars(args))
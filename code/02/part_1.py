@@ -34,9 +34,9 @@ of wrapping paper should they order?
 def get_total_wrapping_paper_area(dimensions):
     """Return the total area needed for all boxes
 
-    This function accepts an iterator which returns length, width,
-    height tuples and determines the total area needed for all of the
-    boxes.
+    This function accepts a sequence of length, width, height tuples
+    (or an N×3 array) and determines the total area needed for all of
+    the boxes.
 
     >>> get_total_wrapping_paper_area([(1, 1, 1)])
     7
@@ -46,11 +46,39 @@ def get_total_wrapping_paper_area(dimensions):
     0
 
     """
-    total_area = 0
-    for (length, width, height) in dimensions:
-        total_area += get_wrapping_paper_area(length, width, height)
+    return get_total_wrapping_paper_area_sorted(sorted_dimensions(dimensions))
 
-    return total_area
+def sorted_dimensions(dimensions):
+    """Return the dimensions as an N×3 array, each box's sorted
+
+    >>> sorted_dimensions([(2, 4, 3), (1, 1, 10)]).tolist()
+    [[2, 3, 4], [1, 1, 10]]
+    >>> sorted_dimensions([]).shape
+    (0, 3)
+
+    """
+    import numpy as np
+
+    boxes = np.asarray(dimensions, dtype=np.int64).reshape(-1, 3)
+
+    return np.sort(boxes, axis=1)
+
+def get_total_wrapping_paper_area_sorted(boxes):
+    """Return the total area needed for boxes from :func:`sorted_dimensions`
+
+    This is :func:`get_wrapping_paper_area` for every box at once: the
+    smallest side of a sorted box is the product of its first two
+    dimensions.
+
+    >>> get_total_wrapping_paper_area_sorted(sorted_dimensions([(4, 3, 2)]))
+    58
+
+    """
+    (smallest, middle, largest) = boxes.T
+    smallest_sides = smallest * middle
+    areas = 2 * (smallest_sides + middle * largest + smallest * largest)
+
+    return int(areas.sum() + smallest_sides.sum())
 
 def get_wrapping_paper_area(length, width, height):
     """Return the area of paper needed to cover the box
@@ -115,13 +143,79 @@ def dimension_reader(fileobj):
         (length, width, height) = dimensions_from_line(line)
         yield (length, width, height)
 
+def dimension_array(text):
+    """Parse every line of a text (or bytes) at once into an N×3 array
+
+    >>> dimension_array("2x3x4\\n1x1x10\\n").tolist()
+    [[2, 3, 4], [1, 1, 10]]
+    >>> dimension_array("").shape
+    (0, 3)
+    >>> dimension_array("2x3x4\\n1x1\\n")
+    Traceback (most recent call last):
+     ...
+    ValueError: Expected LxWxH on every line
+    >>> dimension_array("2x3\\n4x5x6x7\\n")
+    Traceback (most recent call last):
+     ...
+    ValueError: Expected LxWxH on every line
+    >>> dimension_array("1xx3 4\\n")
+    Traceback (most recent call last):
+     ...
+    ValueError: Expected LxWxH on every line
+    >>> dimension_array("1x2x3 4\\nx5x6\\n")
+    Traceback (most recent call last):
+     ...
+    ValueError: Expected LxWxH on every line
+    >>> dimension_array("1x2x3\\n4x5x6").tolist()
+    [[1, 2, 3], [4, 5, 6]]
+
+    """
+    import numpy as np
+
+    if isinstance(text, str):
+        text = text.encode('ascii')
+    text = bytes(text).replace(b'\r\n', b'\n')
+    if text and not text.endswith(b'\n'):
+        text += b'\n'
+
+    # Every line must be digits, 'x', digits, 'x', digits and a newline:
+    # only digits between the separators, the separators going 'x',
+    # 'x', newline in turn, and at least one digit before each of them.
+    data = np.frombuffer(text, dtype=np.uint8)
+    is_separator = (data == ord('x')) | (data == ord('\n'))
+    is_digit = (data >= ord('0')) & (data <= ord('9'))
+    positions = np.flatnonzero(is_separator)
+    expected = np.tile(np.frombuffer(b'xx\n', dtype=np.uint8), len(positions) // 3)
+
+    if (not (is_separator | is_digit).all()
+            or not np.array_equal(data[positions], expected)
+            or not (np.diff(positions, prepend=-1) > 1).all()):
+        raise ValueError("Expected LxWxH on every line")
+
+    values = np.fromstring(text.replace(b'x', b' '), dtype=np.int64, sep=' ')
+
+    return values.reshape(-1, 3)
+
+def parse(fileobj):
+    """Return the N×3 array of dimensions contained in the input file"""
+    return dimension_array(fileobj.read())
+
+def parse_bytes(data):
+    """Return the N×3 array of dimensions contained in the raw input"""
+    return dimension_array(data)
+
+def solve(dimensions):
+    """Return the total wrapping paper area for the dimensions"""
+    return get_total_wrapping_paper_area(dimensions)
+
 def main(filename):
     """Read dimensions from file and print the total wrapping paper area"""
     with open(filename, 'r') as f:
-        iterator = dimension_reader(f)
-        total_area = get_total_wrapping_paper_area(iterator)
+        dimensions = parse(f)
+
+    total_area = solve(dimensions)
 
-        print(total_area)
+    print(total_area)
 
 if __name__ == "__main__":
     import argparse
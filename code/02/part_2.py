@@ -35,8 +35,16 @@ How many total feet of ribbon should they order?
 
 """
 
+import functools
+import os
+import sys
+import time
+
 import part_1
 
+# Number of bytes of the manifest each worker reads at a time
+CHUNK_SIZE = 16 << 20
+
 def get_total_ribbon(dimensions):
     """Return the total ribbon needed for all presents
 
@@ -49,11 +57,25 @@ def get_total_ribbon(dimensions):
     39
 
     """
-    total_length = 0
-    for (length, width, height) in dimensions:
-        total_length += get_total_ribbon_for_present(length, width, height)
+    return get_total_ribbon_sorted(part_1.sorted_dimensions(dimensions))
+
+def get_total_ribbon_sorted(boxes):
+    """Return the total ribbon needed for boxes from
+    :func:`part_1.sorted_dimensions`
 
-    return total_length
+    This is :func:`get_total_ribbon_for_present` for every box at
+    once: the smallest perimeter of a sorted box is twice the sum of
+    its first two dimensions.
+
+    >>> get_total_ribbon_sorted(part_1.sorted_dimensions([(4, 3, 2)]))
+    34
+
+    """
+    (smallest, middle, largest) = boxes.T
+    wrapping = 2 * (smallest + middle)
+    bows = smallest * middle * largest
+
+    return int(wrapping.sum() + bows.sum())
 
 def get_total_ribbon_for_present(length, width, height):
     """Return the total ribbon needed for one present
@@ -116,19 +138,137 @@ def get_ribbon_for_bow(length, width, height):
 
     return ribbon_length
 
-def main(filename):
-    """Read dimensions from file and print the total ribbon needed"""
-    with open(filename, 'r') as f:
-        iterator = part_1.dimension_reader(f)
-        total_ribbon = get_total_ribbon(iterator)
+def solve(dimensions):
+    """Return the total ribbon needed for the dimensions"""
+    return get_total_ribbon(dimensions)
+
+def solve_both(dimensions):
+    """Return the total wrapping paper area and ribbon, sorting each box
+    once"""
+    boxes = part_1.sorted_dimensions(dimensions)
+
+    return (
+        part_1.get_total_wrapping_paper_area_sorted(boxes),
+        get_total_ribbon_sorted(boxes),
+    )
+
+def line_ranges(filename, chunk_size):
+    """Yield (start, end) byte ranges of about `chunk_size` bytes of a
+    file, each ending at the end of a line
+
+    >>> import tempfile
+    >>> with tempfile.NamedTemporaryFile() as f:
+    ...     _ = f.write(b"2x3x4\\n1x1x10\\n5x5x5\\n")
+    ...     f.flush()
+    ...     list(line_ranges(f.name, 8))
+    [(0, 13), (13, 19)]
+    >>> list(line_ranges(__file__, 0))
+    Traceback (most recent call last):
+     ...
+    ValueError: Chunks must be at least 1 byte, not 0
+
+    """
+    if chunk_size < 1:
+        raise ValueError("Chunks must be at least 1 byte, not {}".format(chunk_size))
+
+    size = os.path.getsize(filename)
+    with open(filename, 'rb') as f:
+        start = 0
+        while start < size:
+            if start + chunk_size >= size:
+                end = size
+            else:
+                # Extend the range to the end of the line it stops in
+                f.seek(start + chunk_size - 1)
+                f.readline()
+                end = f.tell()
+
+            yield (start, end)
+            start = end
+
+def total_range(filename, byte_range):
+    """Return the (wrapping paper, ribbon, boxes) totals of the lines in
+    a range of bytes of a file"""
+    (start, end) = byte_range
+    with open(filename, 'rb') as f:
+        f.seek(start)
+        lines = f.read(end - start).decode('ascii').splitlines()
+
+    total_paper = 0
+    total_ribbon = 0
+    for line in lines:
+        (length, width, height) = part_1.dimensions_from_line(line)
+        total_paper += part_1.get_wrapping_paper_area(length, width, height)
+        total_ribbon += get_total_ribbon_for_present(length, width, height)
+
+    return (total_paper, total_ribbon, len(lines))
+
+def total_file(filename, num_processes, chunk_size=CHUNK_SIZE):
+    """Return the (wrapping paper, ribbon, boxes) totals of a file of any
+    size, using several processes
+
+    The file is split at line boundaries into ranges of about
+    `chunk_size` bytes, which the processes total independently, so
+    that no more than one range per process is in memory at a time.
+
+    """
+    import multiprocessing
+
+    total_paper = 0
+    total_ribbon = 0
+    total_boxes = 0
+    with multiprocessing.Pool(num_processes) as pool:
+        totals = pool.imap_unordered(
+            functools.partial(total_range, filename),
+            line_ranges(filename, chunk_size),
+        )
+
+        for (paper, ribbon, boxes) in totals:
+            total_paper += paper
+            total_ribbon += ribbon
+            total_boxes += boxes
+
+    return (total_paper, total_ribbon, total_boxes)
+
+def main(filename, num_processes, chunk_size):
+    """Print the total ribbon needed for the dimensions in a file
+
+    The whole file is parsed at once, unless `num_processes` is given,
+    in which case it is streamed through that many processes in ranges
+    of about `chunk_size` bytes, and the lines per second they total
+    are reported on stderr.
+
+    """
+    if num_processes is None:
+        with open(filename, 'r') as f:
+            dimensions = part_1.parse(f)
+
+        total_ribbon = solve(dimensions)
+    else:
+        start = time.perf_counter()
+        (_, total_ribbon, boxes) = total_file(filename, num_processes, chunk_size)
+        elapsed = time.perf_counter() - start
+
+        print("{} lines in {:.3f}s ({:.0f} lines/s)".format(
+            boxes, elapsed, boxes / elapsed if elapsed else 0), file=sys.stderr)
 
-        print(total_ribbon)
+    print(total_ribbon)
 
 if __name__ == "__main__":
     import argparse
 
     parser = argparse.ArgumentParser()
     parser.add_argument('filename')
+    parser.add_argument('--num-processes', type=int,
+                        help='Stream the file through this many processes '
+                             'instead of loading it into memory')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE,
+                        help='Bytes of the file each process reads at a time '
+                             '(default: {})'.format(CHUNK_SIZE))
     args = parser.parse_args()
+    if args.num_processes is not None and args.num_processes < 1:
+        parser.error('--num-processes must be at least 1')
+    if args.chunk_size < 1:
+        parser.error('--chunk-size must be at least 1')
 
     main(**vars(args))
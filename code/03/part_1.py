@@ -35,6 +35,47 @@ How many houses receive at least one present?
 
 import collections
 
+# Positions can also be packed into a single int key, `row << 32` plus
+# `col`, which is cheap to hash and moves with a single addition as
+# long as every column fits in 32 bits.
+COL_BITS = 32
+
+# Ways of counting houses: a grid covering the walk, or sorted keys
+BACKENDS = ('dense', 'sparse')
+
+# Number of keys placed on the grid at a time by the dense backend
+DENSE_CHUNK_SIZE = 1 << 16
+
+MOVES = {
+    '>': 1,
+    'v': 1 << COL_BITS,
+    '<': -1,
+    '^': -(1 << COL_BITS),
+}
+
+def pack(row, col):
+    """Return the key of a position
+
+    >>> pack(0, 1)
+    1
+    >>> pack(1, 0) == 1 << COL_BITS
+    True
+    >>> unpack(pack(-3, -7))
+    (-3, -7)
+
+    """
+    return (row << COL_BITS) + col
+
+def unpack(key):
+    """Return the (row, col) of a key, or of each key of a numpy array
+
+    >>> unpack(pack(2, -1))
+    (2, -1)
+
+    """
+    row = (key + (1 << (COL_BITS - 1))) >> COL_BITS
+    return (row, key - (row << COL_BITS))
+
 class Position:
     """Represent a position in two-dimensional space
 
@@ -55,13 +96,27 @@ class Position:
     >>> a
     Position(0, 0)
 
+    >>> Position(1, -1).key() == pack(1, -1)
+    True
+    >>> Position.from_key(pack(1, -1))
+    Position(1, -1)
+
     """
+    __slots__ = ('row', 'col')
+
     def __init__(self, row, col):
         self.row = row
         self.col = col
 
+    @classmethod
+    def from_key(cls, key):
+        return cls(*unpack(key))
+
+    def key(self):
+        return pack(self.row, self.col)
+
     def __hash__(self):
-        return hash((self.row, self.col))
+        return hash(self.key())
 
     def __eq__(self, other):
         return (self.row, self.col) == (other.row, other.col)
@@ -128,12 +183,7 @@ def get_presents_per_house(positions):
     True
 
     """
-    presents_per_house = collections.defaultdict(int)
-
-    for position in positions:
-        presents_per_house[position] += 1
-
-    return presents_per_house
+    return collections.Counter(positions)
 
 def decode_instruction(instruction, position):
     """Return a new position based on the instruction
@@ -170,6 +220,223 @@ def decode_instruction(instruction, position):
     else:
         raise ValueError("Instruction must be one of '>v<^'")
 
+def get_keys(instructions):
+    """Generate the key of each new position based on the instructions
+
+    >>> [unpack(key) for key in get_keys(">v")]
+    [(0, 0), (0, 1), (1, 1)]
+    >>> list(get_keys("X"))
+    Traceback (most recent call last):
+     ...
+    ValueError: Instruction must be one of '>v<^'
+
+    """
+    key = 0
+    yield key
+
+    try:
+        for instruction in instructions:
+            key += MOVES[instruction]
+            yield key
+    except KeyError:
+        raise ValueError("Instruction must be one of '>v<^'") from None
+
+def get_moves(instructions):
+    """Return the change in key of each instruction as a numpy array
+
+    >>> get_moves("><").tolist()
+    [1, -1]
+    >>> get_moves("><X")
+    Traceback (most recent call last):
+     ...
+    ValueError: Instruction must be one of '>v<^'
+
+    """
+    import numpy as np
+
+    if isinstance(instructions, str):
+        instructions = instructions.encode('ascii')
+
+    moves = np.zeros(256, dtype=np.int64)
+    valid = np.zeros(256, dtype=bool)
+    for (instruction, move) in MOVES.items():
+        moves[ord(instruction)] = move
+        valid[ord(instruction)] = True
+
+    codes = np.frombuffer(instructions, dtype=np.uint8)
+    if not valid[codes].all():
+        raise ValueError("Instruction must be one of '>v<^'")
+
+    return moves[codes]
+
+def walk(instructions):
+    """Return the key of every position of a walk as a numpy array
+
+    Since keys are packed linearly, the key of each position is the
+    cumulative sum of the moves before it.
+
+    >>> walk(">v<^").tolist() == [pack(0, 0), pack(0, 1), pack(1, 1), pack(1, 0), pack(0, 0)]
+    True
+    >>> walk(b"").tolist()
+    [0]
+    >>> walk("><X")
+    Traceback (most recent call last):
+     ...
+    ValueError: Instruction must be one of '>v<^'
+
+    """
+    import numpy as np
+
+    moves = get_moves(instructions)
+
+    keys = np.empty(len(moves) + 1, dtype=np.int64)
+    keys[0] = 0
+    np.cumsum(moves, out=keys[1:])
+
+    return keys
+
+def bounding_box(keys):
+    """Return the (top, left, height, width) of the smallest grid
+    holding every key of a walk
+
+    >>> bounding_box(walk("^^>>>v"))
+    (-2, 0, 3, 4)
+
+    """
+    # Rows increase with keys, so only the columns need unpacking
+    (top, _) = unpack(int(keys.min()))
+    (bottom, _) = unpack(int(keys.max()))
+
+    (left, right) = (0, 0)
+    for start in range(0, len(keys), DENSE_CHUNK_SIZE):
+        (_, cols) = unpack(keys[start:start + DENSE_CHUNK_SIZE])
+        left = min(left, int(cols.min()))
+        right = max(right, int(cols.max()))
+
+    return (top, left, bottom - top + 1, right - left + 1)
+
+def choose_backend(keys, backend=None, cell_size=1):
+    """Return the backend to count the houses of a walk with, and the
+    bounding box of the walk if it is needed
+
+    Unless one of `BACKENDS` is given, the backend using the least
+    memory is chosen: a grid covering the walk with cells of
+    `cell_size` bytes, or a sorted copy of the keys.
+
+    >>> choose_backend(walk("^>" * 10))
+    ('dense', (-10, 0, 11, 11))
+    >>> choose_backend(walk("^>" * 10), cell_size=8)
+    ('sparse', None)
+    >>> choose_backend(walk("^" * 1000 + ">" * 1000))
+    ('sparse', None)
+    >>> choose_backend(walk("^"), 'sparse')
+    ('sparse', None)
+    >>> choose_backend(walk("^"), 'bitmap')
+    Traceback (most recent call last):
+     ...
+    ValueError: Backend must be one of ('dense', 'sparse')
+
+    """
+    if backend not in BACKENDS + (None, ):
+        raise ValueError("Backend must be one of {}".format(BACKENDS))
+
+    if backend == 'sparse' or not len(keys):
+        return ('sparse', None)
+
+    box = bounding_box(keys)
+    (_, _, height, width) = box
+    if backend is None and height * width * cell_size > keys.nbytes:
+        return ('sparse', None)
+
+    return ('dense', box)
+
+def grid_indices(keys, box):
+    """Return the index of each key in a flattened grid covering `box`
+
+    Grid indices are in the same order as keys.
+
+    >>> keys = walk("^^>>>v")
+    >>> grid_indices(keys, bounding_box(keys)).tolist()
+    [8, 4, 0, 1, 2, 3, 7]
+
+    """
+    (top, left, _, width) = box
+    (rows, _) = unpack(keys)
+
+    # The same as (rows - top) * width + (cols - left)
+    indices = keys - rows * ((1 << COL_BITS) - width)
+    indices -= top * width + left
+
+    return indices
+
+def count_presents(keys, backend=None):
+    """Return the keys of the houses visited and their number of presents
+
+    The keys are sorted, and the presents match what
+    `get_presents_per_house` finds for the same walk. `backend` is
+    passed to `choose_backend`.
+
+    >>> (houses, presents) = count_presents(walk("^v^v"))
+    >>> ([unpack(key) for key in houses.tolist()], presents.tolist())
+    ([(-1, 0), (0, 0)], [2, 3])
+    >>> dict(zip(houses.tolist(), presents.tolist())) == get_presents_per_house(get_keys("^v^v"))
+    True
+    >>> [count_presents(walk(">^<v"), backend)[1].tolist() for backend in BACKENDS]
+    [[1, 1, 2, 1], [1, 1, 2, 1]]
+
+    """
+    import numpy as np
+
+    (backend, box) = choose_backend(keys, backend, np.dtype(np.int64).itemsize)
+    if backend == 'dense':
+        (top, left, height, width) = box
+
+        presents = np.zeros(height * width, dtype=np.int64)
+        for start in range(0, len(keys), DENSE_CHUNK_SIZE):
+            chunk = keys[start:start + DENSE_CHUNK_SIZE]
+            np.add.at(presents, grid_indices(chunk, box), 1)
+
+        cells = np.flatnonzero(presents)
+        houses = pack(cells // width + top, cells % width + left)
+
+        return (houses, presents[cells])
+    else:
+        keys = np.sort(keys)
+        starts = np.flatnonzero(np.diff(keys, prepend=keys[:1] - 1))
+
+        return (keys[starts], np.diff(starts, append=len(keys)))
+
+def count_houses(keys, backend=None):
+    """Return the number of distinct houses visited
+
+    `backend` is passed to `choose_backend`.
+
+    >>> count_houses(walk("^v^v^v^v^v"))
+    2
+    >>> count_houses(walk("")[:0])
+    0
+    >>> [count_houses(walk("^>v<^"), backend) for backend in BACKENDS]
+    [4, 4]
+
+    """
+    import numpy as np
+
+    (backend, box) = choose_backend(keys, backend)
+    if backend == 'dense':
+        (_, _, height, width) = box
+
+        visited = np.zeros(height * width, dtype=bool)
+        for start in range(0, len(keys), DENSE_CHUNK_SIZE):
+            chunk = keys[start:start + DENSE_CHUNK_SIZE]
+            visited[grid_indices(chunk, box)] = True
+
+        return int(np.count_nonzero(visited))
+    else:
+        # Sorting and counting the changes is much faster than np.unique
+        keys = np.sort(keys)
+
+        return 1 + int(np.count_nonzero(keys[1:] != keys[:-1])) if len(keys) else 0
+
 def get_positions(instructions):
     """Generate each new position based on the instructions
 
@@ -181,21 +448,34 @@ def get_positions(instructions):
     [Position(0, 0), Position(0, 1), Position(1, 1), Position(1, 0), Position(0, 0)]
 
     """
-    position = Position(0, 0)
-    yield position
+    for key in get_keys(instructions):
+        yield Position.from_key(key)
+
+def parse(fileobj):
+    """Return the instructions contained in the input file"""
+    return fileobj.read()
+
+def parse_bytes(data):
+    """Return the instructions contained in the raw bytes of the input"""
+    return bytes(data)
 
-    for instruction in instructions:
-        position = decode_instruction(instruction, position)
-        yield position
+def solve(instructions, backend=None):
+    """Return the total number of houses visited
+
+    >>> solve("^>v<")
+    4
+    >>> solve("^>v<", 'sparse')
+    4
+
+    """
+    return count_houses(walk(instructions), backend)
 
-def main(filename):
+def main(filename, backend):
     """Print the total number of houses visited based on the instructions"""
     with open(filename, 'r') as f:
-        instructions = f.read()
+        instructions = parse(f)
 
-    positions = get_positions(instructions)
-    presents_per_house = get_presents_per_house(positions)
-    total_houses_visited = get_total_houses_visited(presents_per_house)
+    total_houses_visited = solve(instructions, backend)
 
     print(total_houses_visited)
 
@@ -204,6 +484,9 @@ if __name__ == "__main__":
 
     parser = argparse.ArgumentParser()
     parser.add_argument('filename')
+    parser.add_argument('--backend', choices=BACKENDS,
+                        help='How to count houses (default: chosen from '
+                             'the size of the area walked)')
     args = parser.parse_args()
 
     main(**vars(args))
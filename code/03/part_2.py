@@ -88,25 +88,60 @@ def split_up_instructions(instructions):
 
     return (santa_instructions, robot_instructions)
 
-def main(filename):
-    """Print the total number of houses visited based on the instructions"""
-    with open(filename, 'r') as f:
-        instructions = f.read()
+def deliver(instructions, num_agents=2):
+    """Return the key of every house delivered to by agents taking turns
+
+    Every agent delivers to the starting house, then the agents take
+    turns following the instructions. The keys of every agent's
+    positions are worked out together, as the cumulative sum of a
+    table of moves with one row per turn and one column per agent, so
+    they can be counted as a single walk with `part_1.count_houses` or
+    `part_1.count_presents`.
+
+    >>> from part_1 import unpack
+    >>> [unpack(key) for key in deliver("^v^", 2).tolist()]
+    [(0, 0), (0, 0), (-1, 0), (1, 0), (-2, 0)]
+    >>> part_1.count_houses(deliver("^>v<", 1))
+    4
+    >>> part_1.count_houses(deliver("^>v<", 4))
+    5
+    >>> deliver("^>v<", 0)
+    Traceback (most recent call last):
+     ...
+    ValueError: There must be at least one agent, not 0
+
+    """
+    import numpy as np
+
+    if num_agents < 1:
+        raise ValueError("There must be at least one agent, not {}".format(num_agents))
+
+    moves = part_1.get_moves(instructions)
 
-    santa_instructions, robot_instructions = split_up_instructions(instructions)
+    turns = -(-len(moves) // num_agents)
+    keys = np.zeros((turns + 1, num_agents), dtype=np.int64)
+    keys.ravel()[num_agents:num_agents + len(moves)] = moves
+    np.cumsum(keys, axis=0, out=keys)
 
-    santa_positions = part_1.get_positions(santa_instructions)
-    robot_positions = part_1.get_positions(robot_instructions)
+    # The agents without a move in the last turn stay where they are,
+    # and must not deliver again
+    return keys.ravel()[:num_agents + len(moves)]
 
-    santa_presents_per_house = part_1.get_presents_per_house(santa_positions)
-    robot_presents_per_house = part_1.get_presents_per_house(robot_positions)
+def solve(instructions, num_agents=2, backend=None):
+    """Return the total number of houses visited by Santa and his robots
 
-    presents_per_house = merge_presents_per_house(
-        santa_presents_per_house,
-        robot_presents_per_house,
-    )
+    >>> solve("^v^v^v^v^v")
+    11
+
+    """
+    return part_1.count_houses(deliver(instructions, num_agents), backend)
+
+def main(filename, num_agents, backend):
+    """Print the total number of houses visited based on the instructions"""
+    with open(filename, 'r') as f:
+        instructions = part_1.parse(f)
 
-    total_houses_visited = part_1.get_total_houses_visited(presents_per_house)
+    total_houses_visited = solve(instructions, num_agents, backend)
 
     print(total_houses_visited)
 
@@ -115,6 +150,13 @@ if __name__ == "__main__":
 
     parser = argparse.ArgumentParser()
     parser.add_argument('filename')
+    parser.add_argument('--num-agents', type=int, default=2,
+                        help='Number of Santas taking turns (default: 2)')
+    parser.add_argument('--backend', choices=part_1.BACKENDS,
+                        help='How to count houses (default: chosen from '
+                             'the size of the area walked)')
     args = parser.parse_args()
+    if args.num_agents < 1:
+        parser.error('--num-agents must be at least 1')
 
     main(**vars(args))
@@ -29,8 +29,22 @@ Find the solution that makes the hash start with 5 zeros.
 
 """
 
-import multiprocessing
 import hashlib
+import os
+import sys
+import time
+
+# Number of consecutive solutions a process tests before checking
+# whether another process has found a solution
+BLOCK_SIZE = 1 << 14
+
+# Solutions are hashed in runs that share all but their last few
+# digits, which are appended from a table of precomputed suffixes
+SUFFIX_DIGITS = 3
+SUFFIXES = [b'%0*d' % (SUFFIX_DIGITS, i) for i in range(10 ** SUFFIX_DIGITS)]
+
+# Seconds between checkpoints and progress reports
+INTERVAL = 10.0
 
 class AdventCoinFinder(object):
     """Find the solution to a particular AdventCoin problem
@@ -41,140 +55,390 @@ class AdventCoinFinder(object):
     across.
 
     >>> finder = AdventCoinFinder(1, "abcdef", 5)
-    >>> finder.find_solution(609000)
+    >>> finder.find_solution(609000)  # slow
     609043
 
-    More specifically, this class functions as follows:
+    Several numbers of zeros can be given at once, in which case a
+    single search finds the lowest solution for each of them: any
+    solution for a number of zeros is also one for fewer zeros.
 
-    - func:`find_solution` creates 1 process that produces batches of
-      solutions (func:`solution_producer`) and multiple testing
-      processes (func:`test_solutions`).
+    >>> AdventCoinFinder(2, "abcdef", {3, 4}, block_size=100).find_each()
+    {3: 3337, 4: 31556}
 
-      It then waits on a `result_queue` which contains tuples of
-      (solution, result), where solution is the integer that was
-      tested, and result is a boolean for whether the solution is
-      actually correct.
+    Long searches can save their progress to a checkpoint file every
+    `interval` seconds (and when they stop), and resume from it.
 
-      If any correct solution is found, we set a flag that alerts the
-      other processes to exit.
+    >>> import tempfile
+    >>> with tempfile.TemporaryDirectory() as directory:
+    ...     checkpoint = os.path.join(directory, 'checkpoint.json')
+    ...     finder = AdventCoinFinder(2, "abcdef", {3, 4}, 1000, checkpoint)
+    ...     first = finder.find_each(0, stop=20000)
+    ...     finder = AdventCoinFinder(2, "abcdef", {3, 4}, 1000, checkpoint)
+    ...     (first, finder.find_each(resume=True), finder.starting_solution)
+    ({3: 3337, 4: -1}, {3: 3337, 4: 31556}, 20000)
 
-    - func:`test_solutions` gets batches of solutions from the
-      `test_queue` that the func:`solution_producer` created, and
-      checks each solution and pushes the result on the `result_queue`.
+    More specifically, this class functions as follows:
 
-    - func:`solution_producer` ensures that there's always enough
-      batches of solutions on the `test_queue`, pushing more on it if
-      necessary.
+    - The solutions from `starting_solution` on are split into blocks
+      of `block_size` consecutive solutions, which are dealt out to
+      the processes in turn: process $k$ of $n$ tests blocks $k$,
+      $k + n$, $k + 2n$, etc.
+
+    - func:`search` tests the blocks of one process in order. Nothing
+      is sent between the processes except for the solutions found,
+      which are kept in a shared `best` array holding the lowest
+      solution so far for each number of zeros (or -1), and the next
+      block of each process, kept in a shared `next_blocks` array.
+
+    - Once a solution is found for the most zeros, a process stops
+      before starting a block above it, but still tests the blocks
+      below it, since they may hold a lower solution. When every
+      process has stopped, every block below the best solution has
+      been completed, so it is the lowest solution.
 
     """
-    def __init__(self, num_processes, starting_string, num_zeros_to_find):
-        """Construct the finder and set up multiprocessing queues"""
+    def __init__(self, num_processes, starting_string, num_zeros_to_find,
+                 block_size=BLOCK_SIZE, checkpoint=None, interval=None,
+                 report=sys.stderr):
+        """Construct the finder and set up the shared solution
+
+        Progress is saved to `checkpoint` (unless it is None) and
+        reported to `report` every `interval` seconds (unless it is
+        None).
+
+        """
+        import multiprocessing
+
+        if isinstance(num_zeros_to_find, int):
+            num_zeros_to_find = [num_zeros_to_find]
+
         self.num_processes = num_processes
         self.starting_string = starting_string
-        self.num_zeros_to_find = num_zeros_to_find
+        self.targets = sorted(set(num_zeros_to_find))
+        self.block_size = block_size
+        self.checkpoint = checkpoint
+        self.interval = interval
+        self.report_file = report
+
+        # The lowest solution found so far for each target, or -1
+        self.best = multiprocessing.Array('q', [-1] * len(self.targets))
+
+        # The start of the next block each process will test, as
+        # every block before it has been tested
+        self.next_blocks = multiprocessing.Array('q', num_processes)
+
+    def __getstate__(self):
+        """Return the state sent to the processes that search
+
+        The report stream is only used by this process, and cannot be
+        pickled for processes that are spawned rather than forked.
+
+        >>> import subprocess
+        >>> subprocess.run(
+        ...     [sys.executable, '-c',
+        ...      'import multiprocessing, part_1; '
+        ...      'multiprocessing.set_start_method("spawn"); '
+        ...      'print(part_1.AdventCoinFinder(2, "abcdef", 3, block_size=100).find_solution())'],
+        ...     cwd=os.path.dirname(os.path.abspath(__file__)),
+        ...     stdout=subprocess.PIPE,
+        ...     universal_newlines=True,
+        ... ).stdout
+        '3337\\n'
 
-        # Holds all the batches of potential solutions
-        self.test_queue = multiprocessing.Queue()
-
-        # Holds all of the results from checking
-        self.result_queue = multiprocessing.Queue()
+        """
+        state = self.__dict__.copy()
+        del state['report_file']
 
-        # Alerts the remaining processes to exit
-        self.finished = multiprocessing.Event()
+        return state
 
-    def find_solution(self, starting_solution=0):
+    def find_solution(self, starting_solution=0, resume=False):
         """Find the solution to the problem
 
-        This function starts all of the processes and waits until a
-        solution is found by one of them.
+        Returns the lowest solution for the most zeros, see
+        func:`find_each`.
+
+        >>> AdventCoinFinder(3, "abcdef", 3, block_size=8).find_solution()
+        3337
+        >>> finder = AdventCoinFinder(4, "abcdef", 4, block_size=7)
+        >>> finder.find_solution(31000)
+        31556
+        >>> finder.checked() > 31556
+        True
 
         """
-        # Creates the solution producer
-        self.producer = multiprocessing.Process(
-            target=self.solution_producer,
-            args=(starting_solution, ),
+        return self.find_each(starting_solution, resume)[self.targets[-1]]
+
+    def find_each(self, starting_solution=0, resume=False, stop=None):
+        """Find the lowest solution for each number of zeros
+
+        This function starts a process for each share of the blocks
+        (or searches in this process if there is only one) and waits
+        until they have all stopped, returning a dict from each number
+        of zeros to its lowest solution (or -1 if there is none below
+        `stop`).
+
+        With `resume`, the search continues from the checkpoint, if
+        there is one, instead of `starting_solution`.
+
+        >>> finder = AdventCoinFinder(1, "abcdef", 3, block_size=5000)
+        >>> finder.find_each(resume=True, stop=3000)
+        {3: -1}
+        >>> finder.checked()
+        3000
+
+        """
+        import multiprocessing
+        import threading
+
+        if resume and self.checkpoint is not None and os.path.exists(self.checkpoint):
+            starting_solution = self.load_checkpoint()
+
+        for k in range(self.num_processes):
+            self.next_blocks[k] = starting_solution + k * self.block_size
+
+        self.starting_solution = starting_solution
+        self.started = time.perf_counter()
+
+        # Reports progress from a thread of this process, which is
+        # only started once the processes have been, so that they
+        # cannot be forked while it holds a lock
+        stopped = threading.Event()
+        monitor = threading.Thread(target=self.monitor, args=(stopped, ))
+
+        try:
+            if self.num_processes == 1:
+                monitor.start()
+                self.search(0, starting_solution, stop)
+            else:
+                processes = [
+                    multiprocessing.Process(
+                        target=self.search,
+                        args=(k, starting_solution, stop),
+                    )
+                    for k in range(self.num_processes)
+                ]
+
+                for process in processes:
+                    process.start()
+                monitor.start()
+                for process in processes:
+                    process.join()
+        finally:
+            stopped.set()
+            if monitor.is_alive():
+                monitor.join()
+
+            self.save_checkpoint()
+
+        return dict(zip(self.targets, self.best))
+
+    def monitor(self, stopped):
+        """Save and report progress every `interval` seconds until the
+        search has stopped"""
+        if self.interval is None:
+            return
+
+        while not stopped.wait(self.interval):
+            self.save_checkpoint()
+            self.report_progress()
+
+    def tested(self):
+        """Return the number of solutions tested so far
+
+        Each process tests one block for every `num_processes` blocks
+        it moves forward by.
+
+        """
+        return sum(
+            (self.next_blocks[k] - self.starting_solution - k * self.block_size)
+            // self.num_processes
+            for k in range(self.num_processes)
         )
 
-        # Creates a process for each of the solution checkers
-        self.processes = [
-            multiprocessing.Process(target=self.test_solutions, args=())
-            for _ in range(self.num_processes)
-        ]
+    def report_progress(self):
+        """Report how far the search has got and how fast it is going"""
+        tested = self.tested()
+        elapsed = time.perf_counter() - self.started
 
-        # Start the threads
-        self.producer.start()
-        for process in self.processes:
-            process.start()
+        print("checked {:,} ({:,.0f} hashes/s), best {}".format(
+            self.checked(),
+            tested / elapsed if elapsed else 0,
+            dict(zip(self.targets, self.best)),
+        ), file=self.report_file, flush=True)
 
-        # Get the solution
-        solution = None
-        while True:
-            solution, result = self.result_queue.get()
-            if result:
-                break
+    def save_checkpoint(self):
+        """Save the solutions found and the solution below which every
+        solution has been tested, if there is a checkpoint file"""
+        import json
+
+        if self.checkpoint is None:
+            return
+
+        state = {
+            'starting_string': self.starting_string,
+            'targets': self.targets,
+            'checked': self.checked(),
+            'best': list(self.best),
+        }
+
+        # Replace the checkpoint in one step, so that it is never left
+        # half-written
+        temporary = self.checkpoint + '.tmp'
+        with open(temporary, 'w') as f:
+            json.dump(state, f)
+            f.write('\n')
+        os.replace(temporary, self.checkpoint)
 
-        # Alert the processes to exit
-        self.finished.set()
+    def load_checkpoint(self):
+        """Restore the solutions found from the checkpoint, returning
+        the solution to continue the search from"""
+        import json
 
-        # Wait for the processes to finish
-        self.producer.join()
-        for process in self.processes:
-            process.join()
+        with open(self.checkpoint, 'r') as f:
+            state = json.load(f)
 
-        return solution
+        if (state['starting_string'], state['targets']) != (self.starting_string, self.targets):
+            raise ValueError("Checkpoint is for a different search")
 
-    def test_solutions(self):
-        """Check each solution to determine if it is correct
+        for (i, solution) in enumerate(state['best']):
+            self.best[i] = solution
 
-        This function reads potential solutions from the producer and
-        checks if it is the correct solution to the current problem.
+        return state['checked']
+
+    def blocks(self, k, starting_solution):
+        """Generate the first solution of each block process `k` tests
+
+        >>> finder = AdventCoinFinder(3, "abcdef", 5, block_size=10)
+        >>> blocks = finder.blocks(1, 100)
+        >>> [next(blocks) for _ in range(3)]
+        [110, 140, 170]
 
         """
+        block_start = starting_solution + k * self.block_size
         while True:
-            # Check if we should exit now
-            if self.finished.is_set():
-                break
+            yield block_start
+            block_start += self.num_processes * self.block_size
+
+    def checked(self):
+        """Return the solution below which every solution has been tested
 
-            # Get the next batch of solutions
-            solutions = self.test_queue.get()
+        Every block before the next block of each process has been
+        tested, so every solution below the lowest of them has been.
 
+        """
+        return min(self.next_blocks)
+
+    def search(self, k, starting_solution, stop=None):
+        """Test the blocks of process `k` until they are above a solution
+        for the most zeros (or above `stop`)"""
+        hardest = len(self.targets) - 1
+        for block_start in self.blocks(k, starting_solution):
+            if 0 <= self.best[hardest] < block_start:
+                return
+            if stop is not None and block_start >= stop:
+                return
+
+            # A block that reaches past `stop` is only tested up to it
+            block_end = block_start + self.block_size
+            next_block = block_start + self.num_processes * self.block_size
+            if stop is not None and block_end > stop:
+                (block_end, next_block) = (stop, stop)
+
+            solutions = find_solutions(
+                self.starting_string,
+                block_start,
+                block_end,
+                self.targets[0],
+            )
             for solution in solutions:
-                # Test each solution to see if it is correct
-                result = check_solution(
-                    self.starting_string,
-                    solution,
-                    self.num_zeros_to_find,
-                )
-
-                # To limit the number of items on the result queue,
-                # only push correct solutions.
-                if result:
-                    self.result_queue.put((solution, result))
-
-    def solution_producer(self, starting_solution):
-        """Produces potential solutions to check"""
-        # The current solution to start the next batch on
-        solution = starting_solution
-
-        # We want the queue to be a certain size so that no process
-        # will have to wait on the next one
-        expected_queue_size = 2 * self.num_processes
-
-        # Each batch of solutions should be this size
-        solutions_per_batch = 64
-
-        # Continue until we are signaled to stop
-        while not self.finished.is_set():
-            # If the queue is too small, we need to push the next
-            # batch onto it
-            while self.test_queue.qsize() < expected_queue_size:
-                solutions = [
-                    solution + i
-                    for i in range(solutions_per_batch)
-                ]
+                # Solutions are rare, so it is cheap to hash them again
+                # to find which targets they meet
+                num_zeros = count_zeros(self.starting_string, solution)
+                self.report(solution, num_zeros)
+                if num_zeros >= self.targets[hardest]:
+                    break
+
+            self.next_blocks[k] = next_block
+
+    def report(self, solution, num_zeros):
+        """Record a solution for each target it meets, if it is the
+        lowest one found so far"""
+        with self.best.get_lock():
+            for (i, target) in enumerate(self.targets):
+                if target > num_zeros:
+                    break
+
+                if self.best[i] < 0 or solution < self.best[i]:
+                    self.best[i] = solution
+
+def digest_limit(num_zeros):
+    """Return the bytes below which an MD5 digest starts with a number
+    of zeros in hexadecimal
+
+    Comparing the raw digest to this is much faster than formatting
+    it as hexadecimal.
+
+    >>> digest_limit(5)
+    b'\\x00\\x00\\x10'
+    >>> digest_limit(6)
+    b'\\x00\\x00\\x01'
+    >>> bytes.fromhex('000001dbbfa3') < digest_limit(5)
+    True
+    >>> bytes.fromhex('000001dbbfa3') < digest_limit(6)
+    False
+
+    """
+    if num_zeros == 0:
+        # Above every digest
+        return b'\xff' * 17
 
-                self.test_queue.put(solutions)
-                solution += solutions_per_batch
+    if num_zeros % 2:
+        return bytes(num_zeros // 2) + b'\x10'
+
+    return bytes(num_zeros // 2 - 1) + b'\x01'
+
+def find_solutions(starting_string, start, stop, num_zeros_to_find):
+    """Generate each correct solution in `range(start, stop)`, in order
+
+    This gives the same solutions as calling `check_solution` on each
+    number, but the MD5 state of the starting string is computed once
+    and copied, and so is the state after all but the last
+    `SUFFIX_DIGITS` digits of a run of solutions.
+
+    >>> list(find_solutions("abcdef", 609000, 609100, 5))
+    [609043]
+    >>> list(find_solutions("abcdef", 0, 5000, 3))
+    [3337]
+    >>> [n for n in range(1100) if check_solution("x", n, 1)] == list(find_solutions("x", 0, 1100, 1))
+    True
+
+    """
+    limit = digest_limit(num_zeros_to_find)
+    prefix = hashlib.md5(starting_string.encode("UTF-8"))
+    run_size = 10 ** SUFFIX_DIGITS
+
+    solution = start
+    while solution < stop:
+        (high, low) = divmod(solution, run_size)
+        run_stop = min(stop, (high + 1) * run_size)
+
+        if high == 0:
+            # Solutions have no leading zeros, so these cannot use the
+            # padded suffixes
+            suffixes = [b'%d' % n for n in range(low, run_stop)]
+            run = prefix
+        else:
+            suffixes = SUFFIXES[low:run_stop - high * run_size]
+            run = prefix.copy()
+            run.update(b'%d' % high)
+
+        for (i, suffix) in enumerate(suffixes):
+            md5 = run.copy()
+            md5.update(suffix)
+            if md5.digest() < limit:
+                yield solution + i
+
+        solution = run_stop
 
 def check_solution(starting_string, solution, num_zeros_to_find):
     """Check if a potential solution is correct
@@ -200,6 +464,18 @@ def check_solution(starting_string, solution, num_zeros_to_find):
     md5 = get_md5_hash(string)
     return md5.startswith("0" * num_zeros_to_find)
 
+def count_zeros(starting_string, solution):
+    """Return the number of zeros the hash of a solution starts with
+
+    >>> count_zeros("abcdef", 609043)
+    5
+    >>> count_zeros("abcdef", 609042)
+    0
+
+    """
+    md5 = get_md5_hash(starting_string + str(solution))
+    return len(md5) - len(md5.lstrip("0"))
+
 def get_md5_hash(string):
     """Find the MD5 hash of a given string
 
@@ -211,23 +487,73 @@ def get_md5_hash(string):
     """
     return hashlib.md5(string.encode("UTF-8")).hexdigest()
 
-def main(filename, num_processes):
-    """Find the 5-zero solution of the AdventCoin problem"""
-    with open(filename, 'r') as f:
-        starting_string = f.read().strip()
+def process_count(num_processes):
+    """Return the number of processes to search with, where 0 means
+    one for each CPU
+
+    >>> process_count(3)
+    3
+    >>> process_count(0) >= 1
+    True
 
+    """
     if num_processes == 0:
+        import multiprocessing
+
         num_processes = multiprocessing.cpu_count()
 
+    return num_processes
+
+def parse(fileobj):
+    """Return the secret key contained in the input file"""
+    return fileobj.read().strip()
+
+def solve(starting_string, num_processes=0):
+    """Return the 5-zero solution of the AdventCoin problem"""
     finder = AdventCoinFinder(
-        num_processes,
+        process_count(num_processes),
         starting_string,
         5,
     )
     solution = finder.find_solution()
 
+    return solution
+
+def main(filename, num_processes, zeros, checkpoint, resume, interval):
+    """Find the 5-zero (or `zeros`-zero) solution of the AdventCoin problem"""
+    with open(filename, 'r') as f:
+        starting_string = parse(f)
+
+    finder = AdventCoinFinder(
+        process_count(num_processes),
+        starting_string,
+        zeros,
+        checkpoint=checkpoint,
+        interval=interval,
+    )
+    solution = finder.find_each(resume=resume)[zeros]
+
     print(solution)
 
+def add_search_arguments(parser):
+    """Add the options for long searches to an argument parser"""
+    parser.add_argument('--checkpoint',
+                        help='Save progress to this file while searching')
+    parser.add_argument('--resume', action='store_true',
+                        help='Continue from the checkpoint, if there is one')
+    parser.add_argument('--interval', type=float, default=None,
+                        help='Seconds between progress reports on stderr '
+                             'and checkpoints (default: {} with a checkpoint, '
+                             'otherwise never)'.format(INTERVAL))
+
+def check_search_arguments(parser, args):
+    """Check the options for long searches, filling in defaults"""
+    if args.resume and args.checkpoint is None:
+        parser.error('--resume requires --checkpoint')
+
+    if args.interval is None and args.checkpoint is not None:
+        args.interval = INTERVAL
+
 if __name__ == "__main__":
     import argparse
 
@@ -235,6 +561,10 @@ if __name__ == "__main__":
     parser.add_argument('filename')
     parser.add_argument('--num-processes', type=int, default=0, nargs='?',
                         help='Number of testing processes (0 means cpu count)')
+    parser.add_argument('--zeros', type=int, default=5,
+                        help='Number of zeros the hash must start with')
+    add_search_arguments(parser)
     args = parser.parse_args()
+    check_search_arguments(parser, args)
 
     main(**vars(args))
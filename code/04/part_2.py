@@ -29,24 +29,48 @@ Find the solution that makes the hash start with 6 zeros.
 
 """
 
-import multiprocessing
-
 import part_1
 
-def main(filename, num_processes):
+def solve(starting_string, num_processes=0):
+    """Return the 6-zero solution of the AdventCoin problem"""
+    finder = part_1.AdventCoinFinder(
+        part_1.process_count(num_processes),
+        starting_string,
+        6,
+    )
+    solution = finder.find_solution()
+
+    return solution
+
+def solve_both(starting_string, num_processes=0):
+    """Return the 5-zero and 6-zero solutions from a single search
+
+    Every 6-zero solution is also a 5-zero one, so the 5-zero solution
+    is found on the way to the 6-zero one.
+
+    """
+    finder = part_1.AdventCoinFinder(
+        part_1.process_count(num_processes),
+        starting_string,
+        {5, 6},
+    )
+    solutions = finder.find_each()
+
+    return (solutions[5], solutions[6])
+
+def main(filename, num_processes, checkpoint, resume, interval):
     """Find the 6-zero solution of the AdventCoin problem"""
     with open(filename, 'r') as f:
-        starting_string = f.read().strip()
-
-    if num_processes == 0:
-        num_processes = multiprocessing.cpu_count()
+        starting_string = part_1.parse(f)
 
     finder = part_1.AdventCoinFinder(
-        num_processes,
+        part_1.process_count(num_processes),
         starting_string,
         6,
+        checkpoint=checkpoint,
+        interval=interval,
     )
-    solution = finder.find_solution()
+    solution = finder.find_solution(resume=resume)
 
     print(solution)
 
@@ -57,6 +81,8 @@ if __name__ == "__main__":
     parser.add_argument('filename')
     parser.add_argument('--num-processes', type=int, default=0, nargs='?',
                         help='Number of testing processes (0 means cpu count)')
+    part_1.add_search_arguments(parser)
     args = parser.parse_args()
+    part_1.check_search_arguments(parser, args)
 
     main(**vars(args))
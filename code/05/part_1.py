@@ -40,6 +40,10 @@ How many strings are nice?
 
 import re
 
+VOWELS = frozenset('aeiou')
+
+NAUGHTY_SEQUENCES = frozenset(('ab', 'cd', 'pq', 'xy'))
+
 def is_string_nice(string):
     """Determine if a string is nice (True) or naughty (False)
 
@@ -138,12 +142,22 @@ def count_vowels(string):
 
     return len(matches)
 
+def parse(fileobj):
+    """Return the list of strings contained in the input file"""
+    return list(fileobj)
+
+def solve(strings):
+    """Return the number of nice strings"""
+    return sum(is_string_nice(string) for string in strings)
+
 def main(filename):
     """Count the number of nice lines in a file"""
     with open(filename, 'r') as f:
-        count = sum(is_string_nice(line) for line in f)
+        strings = parse(f)
+
+    count = solve(strings)
 
-        print(count)
+    print(count)
 
 if __name__ == "__main__":
     import argparse
@@ -40,6 +40,8 @@ How many strings are nice under these new rules?
 
 import re
 
+import part_1
+
 def is_string_nice(string):
     """Determine if a string is nice (True) or naughty (False)
 
@@ -87,12 +89,98 @@ def has_paired_characters(string):
     """
     return bool(re.search(r'(..).*\1', string))
 
+def classify(string):
+    """Determine if a string is nice under the old rules and under the
+    new rules, returning both verdicts
+
+    This gives the same verdicts as `part_1.is_string_nice` and
+    `is_string_nice`, but checks all five rules in a single walk over
+    the string, which stops as soon as both verdicts are known.
+
+    >>> classify("ugknbfddgicrmopn")
+    (True, False)
+    >>> classify("qjhvhtzxzqqjkmpb")
+    (False, True)
+    >>> classify("aaaa")
+    (True, True)
+    >>> classify("haegwjzuvuyypxyu")
+    (False, False)
+    >>> strings = ["xxyxx", "uurcxstgmygtbstg", "aabcdefgaa", "dvszwmarrgswjxmb"]
+    >>> all(classify(s) == (part_1.is_string_nice(s), is_string_nice(s)) for s in strings)
+    True
+
+    """
+    vowels = part_1.VOWELS
+    naughty_sequences = part_1.NAUGHTY_SEQUENCES
+
+    num_vowels = 0
+    has_double_letters = False
+    has_naughty_sequence = False
+    has_separated_repeats = False
+    has_paired_characters = False
+
+    # Where each pair of characters was first seen
+    pairs = {}
+
+    before_previous = previous = ''
+    for (i, character) in enumerate(string):
+        if character in vowels:
+            num_vowels += 1
+
+        if character == previous:
+            has_double_letters = True
+        if character == before_previous:
+            has_separated_repeats = True
+
+        pair = previous + character
+        if pair in naughty_sequences:
+            has_naughty_sequence = True
+        if pair not in pairs:
+            pairs[pair] = i
+        elif pairs[pair] < i - 1:
+            # The pairs do not overlap
+            has_paired_characters = True
+
+        if has_naughty_sequence and has_separated_repeats and has_paired_characters:
+            return (False, True)
+
+        before_previous = previous
+        previous = character
+
+    return (
+        num_vowels >= 3 and has_double_letters and not has_naughty_sequence,
+        has_separated_repeats and has_paired_characters,
+    )
+
+def solve(strings):
+    """Return the number of nice strings under the new rules"""
+    return sum(is_string_nice(string) for string in strings)
+
+def solve_both(strings):
+    """Return the number of nice strings under both sets of rules,
+    classifying each string once
+
+    >>> solve_both(["ugknbfddgicrmopn", "qjhvhtzxzqqjkmpb", "aaaa"])
+    (2, 2)
+
+    """
+    old_nice = 0
+    new_nice = 0
+    for string in strings:
+        (old, new) = classify(string)
+        old_nice += old
+        new_nice += new
+
+    return (old_nice, new_nice)
+
 def main(filename):
     """Count the number of nice lines in a file"""
     with open(filename, 'r') as f:
-        count = sum(is_string_nice(line) for line in f)
+        strings = part_1.parse(f)
+
+    count = solve(strings)
 
-        print(count)
+    print(count)
 
 if __name__ == "__main__":
     import argparse
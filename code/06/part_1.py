@@ -43,8 +43,6 @@ After following the instructions, how many lights are lit?
 import enum
 import re
 
-import numpy as np
-
 class ChristmasLightState(enum.IntEnum):
     OFF = 0
     ON = 1
@@ -71,10 +69,14 @@ class ChristmasLights(object):
     """
     def __init__(self, size=1000):
         """Create the grid and set every light to off"""
+        import numpy as np
+
         self.size = size
         self.lights = ChristmasLightState.OFF * np.ones((self.size, self.size))
 
     def __eq__(self, other):
+        import numpy as np
+
         return np.all(self.lights == other.lights)
 
     def copy(self):
@@ -93,11 +95,14 @@ class ChristmasLights(object):
         9
 
         """
+        import numpy as np
+
         return int(np.sum(self.lights))
 
     def toggle(self, top, left, bottom, right):
         """Toggle lights in the given range
 
+        >>> import numpy as np
         >>> l = ChristmasLights(4)
         >>> l.toggle(0, 1, 3, 2)
         >>> expected = np.array([[0, 1, 1, 0]] * 4)
@@ -120,6 +125,7 @@ class ChristmasLights(object):
     def turn_on(self, top, left, bottom, right):
         """Turn on lights in the given range
 
+        >>> import numpy as np
         >>> l = ChristmasLights(4)
         >>> l.turn_on(0, 0, 1, 1)
         >>> l.turn_on(2, 2, 3, 3)
@@ -138,6 +144,7 @@ class ChristmasLights(object):
     def turn_off(self, top, left, bottom, right):
         """Turn off lights in the given range
 
+        >>> import numpy as np
         >>> l = ChristmasLights(4)
         >>> l.turn_on(0, 0, 3, 3)
         >>> l.turn_off(0, 0, 1, 1)
@@ -203,21 +210,50 @@ def parse_and_update(lights, string):
      ...
     ValueError: Unrecognized command
 
+    """
+    update(lights, parse_command(string))
+
+def update(lights, command):
+    """Apply a command from func:`parse_command` to the lights
+
+    >>> l = ChristmasLights(4)
+    >>> update(l, ('turn_on', (0, 1, 2, 3)))
+    >>> l.count_lit()
+    9
+
+    """
+    (name, positions) = command
+    getattr(lights, name)(*positions)
+
+def parse_command(string):
+    """Parse the given string into a (name, positions) command
+
+    The name is the method of :class:`ChristmasLights` to call with
+    the positions.
+
+    >>> parse_command("turn on 0,1 through 2,3")
+    ('turn_on', (0, 1, 2, 3))
+    >>> parse_command("turn off 0,1 through 2,3")
+    ('turn_off', (0, 1, 2, 3))
+    >>> parse_command("toggle 0,1 through 2,3")
+    ('toggle', (0, 1, 2, 3))
+    >>> parse_command("hello world")
+    Traceback (most recent call last):
+     ...
+    ValueError: Unrecognized command
+
     """
     positions = try_parse_turn_on(string)
     if positions:
-        lights.turn_on(*positions)
-        return
+        return ('turn_on', positions)
 
     positions = try_parse_turn_off(string)
     if positions:
-        lights.turn_off(*positions)
-        return
+        return ('turn_off', positions)
 
     positions = try_parse_toggle(string)
     if positions:
-        lights.toggle(*positions)
-        return
+        return ('toggle', positions)
 
     raise ValueError("Unrecognized command")
 
@@ -303,14 +339,24 @@ def try_parse_toggle(string):
 
     return positions
 
+def parse(fileobj):
+    """Return the list of commands contained in the input file"""
+    return [parse_command(line) for line in fileobj]
+
+def solve(commands):
+    """Return the number of lights lit after following the commands"""
+    lights = ChristmasLights(1000)
+    for command in commands:
+        update(lights, command)
+
+    return lights.count_lit()
+
 def main(filename):
     """Read instructions for lights and count lit ones"""
-    lights = ChristmasLights(1000)
     with open(filename, 'r') as f:
-        for line in f:
-            parse_and_update(lights, line)
+        commands = parse(f)
 
-    count = lights.count_lit()
+    count = solve(commands)
     print(count)
 
 if __name__ == "__main__":
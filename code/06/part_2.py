@@ -33,8 +33,6 @@ Santa's instructions?
 
 """
 
-import numpy as np
-
 import part_1
 
 class RevisedChristmasLights(part_1.ChristmasLights):
@@ -73,11 +71,14 @@ class RevisedChristmasLights(part_1.ChristmasLights):
         10
 
         """
+        import numpy as np
+
         return int(np.sum(self.lights))
 
     def toggle(self, top, left, bottom, right):
         """Increment brightness of given lights by 2
 
+        >>> import numpy as np
         >>> l = RevisedChristmasLights(4)
         >>> l.toggle(0, 1, 3, 2)
         >>> expected = np.array([[0, 2, 2, 0]] * 4)
@@ -100,6 +101,7 @@ class RevisedChristmasLights(part_1.ChristmasLights):
     def turn_on(self, top, left, bottom, right):
         """Increment brightness of given lights by 1
 
+        >>> import numpy as np
         >>> l = RevisedChristmasLights(4)
         >>> l.turn_on(0, 0, 2, 2)
         >>> l.turn_on(1, 1, 3, 3)
@@ -118,6 +120,7 @@ class RevisedChristmasLights(part_1.ChristmasLights):
     def turn_off(self, top, left, bottom, right):
         """Decrease brightness of given lights by 1, to a minimum of 0
 
+        >>> import numpy as np
         >>> l = RevisedChristmasLights(4)
         >>> l.turn_on(0, 0, 3, 3)
         >>> l.turn_on(0, 0, 3, 3)
@@ -135,14 +138,20 @@ class RevisedChristmasLights(part_1.ChristmasLights):
         """
         self._multiply_add_and_clamp(top, left, bottom, right, 1, -1)
 
+def solve(commands):
+    """Return the total brightness after following the commands"""
+    lights = RevisedChristmasLights(1000)
+    for command in commands:
+        part_1.update(lights, command)
+
+    return lights.brightness()
+
 def main(filename):
     """Read instructions for lights and count lit ones"""
-    lights = RevisedChristmasLights(1000)
     with open(filename, 'r') as f:
-        for line in f:
-            part_1.parse_and_update(lights, line)
+        commands = part_1.parse(f)
 
-    brightness = lights.brightness()
+    brightness = solve(commands)
     print(brightness)
 
 if __name__ == "__main__":
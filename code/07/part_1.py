@@ -501,15 +501,36 @@ def parse_line_and_update(circuit, line):
 
     raise ValueError("Unrecognized line: '{}'".format(line))
 
+def parse(fileobj):
+    """Return the list of statements contained in the input file"""
+    return [line.strip() for line in fileobj]
+
+def build_circuit(statements):
+    """Return a new circuit built from the statements"""
+    circuit = Circuit()
+    for statement in statements:
+        parse_line_and_update(circuit, statement)
+
+    return circuit
+
+def solve(statements):
+    """Return the signal provided to wire 'a'
+
+    >>> solve(["123 -> b", "NOT b -> a"])
+    65412
+
+    """
+    circuit = build_circuit(statements)
+
+    wire_a = circuit.get_wire('a')
+    return wire_a.get_value()
+
 def main(filename):
     """Read instructions for circuit and report wire 'a'"""
-    circuit = Circuit()
     with open(filename, 'r') as f:
-        for line in f:
-            parse_line_and_update(circuit, line)
+        statements = parse(f)
 
-    wire_a = circuit.get_wire('a')
-    print(wire_a.get_value())
+    print(solve(statements))
 
 if __name__ == "__main__":
     import argparse
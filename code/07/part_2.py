@@ -14,12 +14,9 @@ What new signal is ultimately provided to wire a?
 
 import part_1
 
-def main(filename):
-    """Read instructions for circuit and report wire 'a'"""
-    circuit = part_1.Circuit()
-    with open(filename, 'r') as f:
-        for line in f:
-            part_1.parse_line_and_update(circuit, line)
+def solve(statements):
+    """Return the signal on wire 'a' after overriding wire 'b' with it"""
+    circuit = part_1.build_circuit(statements)
 
     wire_a = circuit.get_wire('a')
 
@@ -27,7 +24,14 @@ def main(filename):
 
     circuit.invalidate()
 
-    print(wire_a.get_value())
+    return wire_a.get_value()
+
+def main(filename):
+    """Read instructions for circuit and report wire 'a'"""
+    with open(filename, 'r') as f:
+        statements = part_1.parse(f)
+
+    print(solve(statements))
 
 if __name__ == "__main__":
     import argparse
@@ -80,17 +80,27 @@ def count_characters(string):
 
     return num_actual_characters, num_code_characters
 
-def main(filename):
-    """Read instructions for circuit and report wire 'a'"""
+def parse(fileobj):
+    """Return the list of string literals contained in the input file"""
+    return list(fileobj)
+
+def solve(lines):
+    """Return the difference between code and in-memory characters"""
     total_actual_characters = 0
     total_code_characters = 0
+    for line in lines:
+        (actual, code) = count_characters(line)
+        total_actual_characters += actual
+        total_code_characters += code
+
+    return total_code_characters - total_actual_characters
+
+def main(filename):
+    """Read string literals and report the character count difference"""
     with open(filename, 'r') as f:
-        for line in f:
-            (actual, code) = count_characters(line)
-            total_actual_characters += actual
-            total_code_characters += code
+        lines = parse(f)
 
-    delta = total_code_characters - total_actual_characters
+    delta = solve(lines)
     print(delta)
 
 if __name__ == "__main__":
@@ -10,18 +10,24 @@ def convert_to_code_representation(string):
     inner = string.replace("\\", "\\\\").replace('"', "\\\"")
     return '"{}"'.format(inner)
 
-def main(filename):
-    """Read instructions for circuit and report wire 'a'"""
+def solve(lines):
+    """Return the difference between encoded and code characters"""
     total_actual_characters = 0
     total_code_characters = 0
+    for line in lines:
+        code_line = convert_to_code_representation(line)
+        (actual, code) = part_1.count_characters(code_line)
+        total_actual_characters += actual
+        total_code_characters += code
+
+    return total_code_characters - total_actual_characters
+
+def main(filename):
+    """Read string literals and report the character count difference"""
     with open(filename, 'r') as f:
-        for line in f:
-            code_line = convert_to_code_representation(line)
-            (actual, code) = part_1.count_characters(code_line)
-            total_actual_characters += actual
-            total_code_characters += code
+        lines = part_1.parse(f)
 
-    delta = total_code_characters - total_actual_characters
+    delta = solve(lines)
     print(delta)
 
 if __name__ == "__main__":
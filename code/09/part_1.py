@@ -46,8 +46,6 @@ What is the distance of the shortest route?
 import collections
 import re
 
-import numpy as np
-
 class World(object):
     """Represent a collection of distances between places"""
     def __init__(self):
@@ -84,13 +82,7 @@ class World(object):
         13.0
 
         """
-        expr = r'([a-zA-Z]+) to ([a-zA-Z]+) = ([0-9]+(?:\.[0-0]+)?)'
-        match = re.match(expr, line)
-        if not match:
-            raise ValueError("Unrecognized line: '{}'".format(line))
-
-        (start, end, distance_string) = match.groups()
-        distance = float(distance_string)
+        (start, end, distance) = parse_distance(line)
 
         self.add_distance(start, end, distance)
 
@@ -155,6 +147,8 @@ class World(object):
                [  4.,  inf,   3.,  inf]])
 
         """
+        import numpy as np
+
         locations = sorted(self.distances.keys())
         location_mapping = { v: i for i, v in enumerate(locations) }
 
@@ -166,6 +160,35 @@ class World(object):
 
         return (locations, distances)
 
+def parse_distance(line):
+    """Parse a line into a (start, end, distance) tuple
+
+    >>> parse_distance("foo to bar = 13")
+    ('foo', 'bar', 13.0)
+    >>> parse_distance("foo to bar")
+    Traceback (most recent call last):
+     ...
+    ValueError: Unrecognized line: 'foo to bar'
+
+    """
+    expr = r'([a-zA-Z]+) to ([a-zA-Z]+) = ([0-9]+(?:\.[0-0]+)?)'
+    match = re.match(expr, line)
+    if not match:
+        raise ValueError("Unrecognized line: '{}'".format(line))
+
+    (start, end, distance_string) = match.groups()
+    distance = float(distance_string)
+
+    return (start, end, distance)
+
+def build_world(distances):
+    """Return a new world from (start, end, distance) tuples"""
+    world = World()
+    for (start, end, distance) in distances:
+        world.add_distance(start, end, distance)
+
+    return world
+
 def standard_test_world():
     world = World()
     world.read_line("A to B = 1")
@@ -272,13 +295,22 @@ def find_extreme_distance(world, minimum=True):
 
     return distance
 
+def parse(fileobj):
+    """Return the list of distances contained in the input file"""
+    return [parse_distance(line) for line in fileobj]
+
+def solve(distances):
+    """Return the distance of the shortest route"""
+    world = build_world(distances)
+
+    return find_extreme_distance(world, minimum=True)
+
 def main(filename):
-    """Read instructions for circuit and report wire 'a'"""
-    world = World()
+    """Read distances and report the shortest route"""
     with open(filename, 'r') as f:
-        world.read_file(f)
+        distances = parse(f)
 
-    shortest_distance = find_extreme_distance(world, minimum=True)
+    shortest_distance = solve(distances)
     print(shortest_distance)
 
 if __name__ == "__main__":
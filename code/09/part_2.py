@@ -20,13 +20,62 @@ What is the distance of the longest route?
 
 import part_1
 
+def find_distance_range_from_location(world, start, visited):
+    """Find the (minimum, maximum) distance of the routes from a location
+
+    This is :func:`part_1.find_extreme_distance_from_location` for
+    both extremes at once, so every route is only followed once.
+
+    >>> world = part_1.standard_test_world()
+    >>> find_distance_range_from_location(world, None, set())
+    (6.0, 9.0)
+
+    """
+    if start is not None:
+        visited = visited | {start}
+
+    candidates = part_1.get_candidates(world, start, visited)
+
+    if len(candidates) == 0:
+        # Routes that do not visit everyone are discarded
+        if len(visited) != len(world.get_locations()):
+            return (float('inf'), -float('inf'))
+
+        return (0, 0)
+
+    minimum = float('inf')
+    maximum = -float('inf')
+    for candidate in candidates:
+        distance = world.get_distance(start, candidate)
+        (shortest, longest) = find_distance_range_from_location(
+            world,
+            candidate,
+            visited,
+        )
+
+        minimum = min(distance + shortest, minimum)
+        maximum = max(distance + longest, maximum)
+
+    return (minimum, maximum)
+
+def solve(distances):
+    """Return the distance of the longest route"""
+    world = part_1.build_world(distances)
+
+    return part_1.find_extreme_distance(world, minimum=False)
+
+def solve_both(distances):
+    """Return the answers to both parts, following each route once"""
+    world = part_1.build_world(distances)
+
+    return find_distance_range_from_location(world, None, set())
+
 def main(filename):
-    """Read instructions for circuit and report wire 'a'"""
-    world = part_1.World()
+    """Read distances and report the longest route"""
     with open(filename, 'r') as f:
-        world.read_file(f)
+        distances = part_1.parse(f)
 
-    longest_distance = part_1.find_extreme_distance(world, minimum=False)
+    longest_distance = solve(distances)
     print(longest_distance)
 
 if __name__ == "__main__":
@@ -64,15 +64,32 @@ def look_and_say_step(look_and_say_iterator):
     yield str(count)
     yield prev
 
+def look_and_say_length(string, steps):
+    """Return the length after applying look-and-say a number of times
+
+    >>> look_and_say_length("1", 5)
+    6
+
+    """
+    for _ in range(steps):
+        string = look_and_say_step(string)
+
+    return sum(1 for _ in string)
+
+def parse(fileobj):
+    """Return the starting digits contained in the input file"""
+    return fileobj.read().strip()
+
+def solve(string):
+    """Return the length after applying look-and-say 40 times"""
+    return look_and_say_length(string, 40)
+
 def main(filename):
     """Read string and apply look-and-say algorithm 40 times"""
     with open(filename, 'r') as f:
-        string = f.read().strip()
-
-    for _ in range(40):
-        string = look_and_say_step(string)
+        string = parse(f)
 
-    length = sum(1 for _ in string)
+    length = solve(string)
     print(length)
 
 if __name__ == "__main__":
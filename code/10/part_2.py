@@ -12,15 +12,24 @@ process 50 times. What is the length of the new result?
 
 import part_1
 
+def solve(string):
+    """Return the length after applying look-and-say 50 times"""
+    return part_1.look_and_say_length(string, 50)
+
+def solve_both(string):
+    """Return the answers to both parts, applying the first 40 steps once"""
+    for _ in range(40):
+        string = part_1.look_and_say_step(string)
+    string = ''.join(string)
+
+    return (len(string), part_1.look_and_say_length(string, 10))
+
 def main(filename):
     """Read string and apply look-and-say algorithm 50 times"""
     with open(filename, 'r') as f:
-        string = f.read().strip()
-
-    for _ in range(50):
-        string = part_1.look_and_say_step(string)
+        string = part_1.parse(f)
 
-    length = sum(1 for _ in string)
+    length = solve(string)
     print(length)
 
 if __name__ == "__main__":
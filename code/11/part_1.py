@@ -189,12 +189,20 @@ def contains_two_pairs_of_letters(password_values):
 
     return num_pairs >= 2
 
+def parse(fileobj):
+    """Return the current password contained in the input file"""
+    return fileobj.read().strip()
+
+def solve(password):
+    """Return the next good password"""
+    return find_good_password(password)
+
 def main(filename):
     """Read password and determine next good one"""
     with open(filename, 'r') as f:
-        string = f.read().strip()
+        string = parse(f)
 
-    password = find_good_password(string)
+    password = solve(string)
     print(password)
 
 if __name__ == "__main__":
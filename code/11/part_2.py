@@ -11,15 +11,26 @@ Santa's password expired again. What's the next one?
 
 import part_1
 
+def solve(password):
+    """Return the second good password after the current one"""
+    # Apply two rounds of the algorithm
+    password = part_1.find_good_password(password)
+    password = part_1.find_good_password(password)
+
+    return password
+
+def solve_both(password):
+    """Return the answers to both parts, finding the first password once"""
+    first_password = part_1.find_good_password(password)
+
+    return (first_password, part_1.find_good_password(first_password))
+
 def main(filename):
     """Read password and determine next good ones"""
     with open(filename, 'r') as f:
-        password = f.read().strip()
+        password = part_1.parse(f)
 
-    # Apply two rounds of the algorithm
-    password = part_1.find_good_password(password)
-    password = part_1.find_good_password(password)
-    print(password)
+    print(solve(password))
 
 if __name__ == "__main__":
     import argparse
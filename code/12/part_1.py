@@ -97,12 +97,20 @@ def recursively_find_numbers(obj):
 
     return 0
 
+def parse(fileobj):
+    """Return the JSON document contained in the input file"""
+    return json.load(fileobj)
+
+def solve(data):
+    """Return the sum of all numbers in the document"""
+    return recursively_find_numbers(data)
+
 def main(filename):
-    """Read password and determine next good one"""
+    """Read JSON document and print the sum of its numbers"""
     with open(filename, 'r') as f:
-        data = json.load(f)
+        data = parse(f)
 
-    sum_of_numbers = recursively_find_numbers(data)
+    sum_of_numbers = solve(data)
     print(sum_of_numbers)
 
 if __name__ == "__main__":
@@ -22,12 +22,16 @@ def recursively_find_numbers(obj):
 
     return 0
 
+def solve(data):
+    """Return the sum of all numbers outside of "red" objects"""
+    return recursively_find_numbers(data)
+
 def main(filename):
-    """Read password and determine next good one"""
+    """Read JSON document and print the sum of its non-red numbers"""
     with open(filename, 'r') as f:
-        data = json.load(f)
+        data = part_1.parse(f)
 
-    sum_of_numbers = recursively_find_numbers(data)
+    sum_of_numbers = solve(data)
     print(sum_of_numbers)
 
 if __name__ == "__main__":
@@ -48,19 +48,32 @@ class Table(object):
 
         return total_happiness
 
-def read_ratings(lines):
+def parse_rating(line):
+    """Parse a line into a (person, next_to, gained) tuple
+
+    >>> parse_rating("Alice would lose 79 happiness units by sitting next to Carol.")
+    ('Alice', 'Carol', -79)
+
+    """
     expr = r'([a-zA-Z]+) would (gain|lose) ([0-9]+) .* to ([a-zA-Z]+)'
-    ratings = HappinessRatings()
-    for line in lines:
-        match = re.match(expr, line)
-        (person, gain_or_lose, rating, next_to) = match.groups()
-        rating = int(rating)
-        rating *= 1 if gain_or_lose == "gain" else -1
+    match = re.match(expr, line)
+    (person, gain_or_lose, rating, next_to) = match.groups()
+    rating = int(rating)
+    rating *= 1 if gain_or_lose == "gain" else -1
+
+    return (person, next_to, rating)
 
+def build_ratings(parsed_ratings):
+    """Return new ratings from (person, next_to, gained) tuples"""
+    ratings = HappinessRatings()
+    for (person, next_to, rating) in parsed_ratings:
         ratings.add_rating(person, next_to, rating)
 
     return ratings
 
+def read_ratings(lines):
+    return build_ratings(parse_rating(line) for line in lines)
+
 def generate_arrangements(guest_list):
     for arrangement in itertools.permutations(guest_list):
         yield Table(arrangement)
@@ -74,12 +87,22 @@ def find_optimal_arrangement(ratings):
 
     return best
 
+def parse(fileobj):
+    """Return the list of ratings contained in the input file"""
+    return [parse_rating(line) for line in fileobj]
+
+def solve(parsed_ratings):
+    """Return the happiness of the optimal seating arrangement"""
+    ratings = build_ratings(parsed_ratings)
+
+    return find_optimal_arrangement(ratings)
+
 def main(filename):
-    """Read password and determine next good one"""
+    """Read ratings and print the happiness of the optimal arrangement"""
     with open(filename, 'r') as f:
-        ratings = read_ratings(f)
+        parsed_ratings = parse(f)
 
-    optimal_happiness = find_optimal_arrangement(ratings)
+    optimal_happiness = solve(parsed_ratings)
     print(optimal_happiness)
 
 if __name__ == "__main__":
@@ -5,16 +5,22 @@
 
 import part_1
 
-def main(filename):
-    """Read password and determine next good one"""
-    with open(filename, 'r') as f:
-        ratings = part_1.read_ratings(f)
+def solve(parsed_ratings):
+    """Return the happiness of the optimal arrangement including yourself"""
+    ratings = part_1.build_ratings(parsed_ratings)
 
     for person in ratings.get_guest_list():
         ratings.add_rating("self", person, 0)
         ratings.add_rating(person, "self", 0)
 
-    optimal_happiness = part_1.find_optimal_arrangement(ratings)
+    return part_1.find_optimal_arrangement(ratings)
+
+def main(filename):
+    """Read ratings and print the happiness of the optimal arrangement"""
+    with open(filename, 'r') as f:
+        parsed_ratings = part_1.parse(f)
+
+    optimal_happiness = solve(parsed_ratings)
     print(optimal_happiness)
 
 if __name__ == "__main__":
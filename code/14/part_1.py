@@ -47,22 +47,33 @@ class Reindeer(object):
 
         return total_distance
 
-def read_reindeers(lines):
+def parse_reindeers(lines):
+    """Return a (name, top_speed, time_at_top_speed, time_resting) tuple
+    for each line
+
+    >>> parse_reindeers(["Comet can fly 14 km/s for 10 seconds, but then must rest for 127 seconds."])
+    [('Comet', 14, 10, 127)]
+
+    """
     matcher = re.compile(r'([A-Za-z]+) .* ([0-9]+) .* ([0-9]+) .* ([0-9]+)')
-    reindeers = []
+    parsed = []
     for line in lines:
         match = matcher.match(line)
         (name, top_speed, time_at_top_speed, time_resting) = match.groups()
-        reindeer = Reindeer(
+        parsed.append((
             name,
             int(top_speed),
             int(time_at_top_speed),
             int(time_resting),
-        )
+        ))
 
-        reindeers.append(reindeer)
+    return parsed
 
-    return reindeers
+def build_reindeers(parsed_reindeers):
+    return [Reindeer(*parsed) for parsed in parsed_reindeers]
+
+def read_reindeers(lines):
+    return build_reindeers(parse_reindeers(lines))
 
 def winning_reindeer(reindeers, time):
     distances = [
@@ -72,15 +83,25 @@ def winning_reindeer(reindeers, time):
 
     return max(distances, key=lambda x: x[1])
 
+def parse(fileobj):
+    """Return the list of reindeer contained in the input file"""
+    return parse_reindeers(fileobj)
+
+def solve(parsed_reindeers):
+    """Return the distance of the winning reindeer after 2503 seconds"""
+    reindeers = build_reindeers(parsed_reindeers)
+
+    _, distance = winning_reindeer(reindeers, 2503)
+
+    return distance
+
 def main(filename):
     """Read reindeer and determine distance of the winning reindeer after
     some time."""
     with open(filename, 'r') as f:
-        reindeers = read_reindeers(f)
-
-    _, distance = winning_reindeer(reindeers, 2503)
+        parsed_reindeers = parse(f)
 
-    print(distance)
+    print(solve(parsed_reindeers))
 
 if __name__ == "__main__":
     import argparse
@@ -15,14 +15,30 @@ def winning_reindeer_by_score(reindeers, time):
 
     return max(scores.items(), key=lambda x: x[1])
 
-def main(filename):
-    """Read password and determine next good one"""
-    with open(filename, 'r') as f:
-        reindeers = part_1.read_reindeers(f)
+def solve(parsed_reindeers):
+    """Return the score of the winning reindeer after 2503 seconds"""
+    reindeers = part_1.build_reindeers(parsed_reindeers)
+
+    _, score = winning_reindeer_by_score(reindeers, 2503)
+
+    return score
 
+def solve_both(parsed_reindeers):
+    """Return the answers to both parts, building the reindeer once"""
+    reindeers = part_1.build_reindeers(parsed_reindeers)
+
+    _, distance = part_1.winning_reindeer(reindeers, 2503)
     _, score = winning_reindeer_by_score(reindeers, 2503)
 
-    print(score)
+    return (distance, score)
+
+def main(filename):
+    """Read reindeer and determine score of the winning reindeer after
+    some time."""
+    with open(filename, 'r') as f:
+        parsed_reindeers = part_1.parse(f)
+
+    print(solve(parsed_reindeers))
 
 if __name__ == "__main__":
     import argparse
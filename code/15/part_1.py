@@ -157,12 +157,22 @@ def find_best_combination(ingredients, total_amount):
 
     return (best_score, best_counts)
 
+def parse(fileobj):
+    """Return the list of ingredients contained in the input file"""
+    return read_ingredients(fileobj)
+
+def solve(ingredients):
+    """Return the score of the best combination of 100 teaspoons"""
+    score, counts = find_best_combination(ingredients, 100)
+
+    return score
+
 def main(filename):
     """Read ingredients and print score of the best combination"""
     with open(filename, 'r') as f:
-        ingredients = read_ingredients(f)
+        ingredients = parse(f)
 
-    score, counts = find_best_combination(ingredients, 100)
+    score = solve(ingredients)
     print(score)
 
 if __name__ == "__main__":
@@ -64,13 +64,46 @@ def find_best_combination(ingredients, total_amount, calories):
 
     return (best_score, best_counts)
 
+def find_best_combinations(ingredients, total_amount, calories):
+    """Find the best score of any combination and the best score of a
+    combination with the given number of calories, in a single pass
+
+    >>> ingredients = [
+    ...     part_1.Ingredient("Butterscotch", -1, -2, 6, 3, 8),
+    ...     part_1.Ingredient("Cinnamon", 2, 3, -2, -1, 3),
+    ... ]
+    >>> find_best_combinations(ingredients, 100, 500)
+    (62842880, 57600000)
+
+    """
+    best_score = 0
+    best_calories_score = 0
+    for counts in part_1.count_combinations(len(ingredients), total_amount):
+        score = part_1.score_ingredients(ingredients, counts)
+
+        best_score = max(score, best_score)
+        if get_calories(ingredients, counts) == calories:
+            best_calories_score = max(score, best_calories_score)
+
+    return (best_score, best_calories_score)
+
+def solve(ingredients):
+    """Return the score of the best combination with 500 calories"""
+    score, counts = find_best_combination(ingredients, 100, 500)
+
+    return score
+
+def solve_both(ingredients):
+    """Return the answers to both parts, scoring each combination once"""
+    return find_best_combinations(ingredients, 100, 500)
+
 def main(filename):
     """Read ingredients and print score of the best combination with 500
     calories"""
     with open(filename, 'r') as f:
-        ingredients = part_1.read_ingredients(f)
+        ingredients = part_1.parse(f)
 
-    score, counts = find_best_combination(ingredients, 100, 500)
+    score = solve(ingredients)
     print(score)
 
 if __name__ == "__main__":
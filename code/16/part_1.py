@@ -20,6 +20,19 @@ class Sue(object):
 
         return cls(int(number), traits)
 
+master_traits = {
+    "children": 3,
+    "cats": 7,
+    "samoyeds": 2,
+    "pomeranians": 3,
+    "akitas": 0,
+    "vizslas": 0,
+    "goldfish": 5,
+    "trees": 3,
+    "cars": 2,
+    "perfumes": 1,
+}
+
 def compatible(master_sue, sue):
     assert len(master_sue.traits) >= len(sue.traits)
 
@@ -29,28 +42,26 @@ def compatible(master_sue, sue):
 
     return True
 
-def main(filename):
-    """Read ingredients and print score of the best combination"""
-    with open(filename, 'r') as f:
-        sues = [Sue.from_line(line) for line in f]
-
-    master_traits = {
-        "children": 3,
-        "cats": 7,
-        "samoyeds": 2,
-        "pomeranians": 3,
-        "akitas": 0,
-        "vizslas": 0,
-        "goldfish": 5,
-        "trees": 3,
-        "cars": 2,
-        "perfumes": 1,
-    }
+def parse(fileobj):
+    """Return the list of Sues contained in the input file"""
+    return [Sue.from_line(line) for line in fileobj]
 
+def solve(sues):
+    """Return the numbers of the Sues compatible with the master Sue"""
     master_sue = Sue(-1, master_traits)
 
-    for compatible_sue in filter(lambda x: compatible(master_sue, x), sues):
-        print(compatible_sue.number)
+    return [
+        compatible_sue.number
+        for compatible_sue in filter(lambda x: compatible(master_sue, x), sues)
+    ]
+
+def main(filename):
+    """Read Sues and print the number of each compatible one"""
+    with open(filename, 'r') as f:
+        sues = parse(f)
+
+    for number in solve(sues):
+        print(number)
 
 if __name__ == "__main__":
     import argparse
@@ -26,28 +26,22 @@ def compatible(master_sue, sue):
 
     return True
 
+def solve(sues):
+    """Return the numbers of the Sues compatible with the master Sue"""
+    master_sue = part_1.Sue(-1, part_1.master_traits)
+
+    return [
+        compatible_sue.number
+        for compatible_sue in filter(lambda x: compatible(master_sue, x), sues)
+    ]
+
 def main(filename):
-    """Read ingredients and print score of the best combination"""
+    """Read Sues and print the number of each compatible one"""
     with open(filename, 'r') as f:
-        sues = [part_1.Sue.from_line(line) for line in f]
-
-    master_traits = {
-        "children": 3,
-        "cats": 7,
-        "samoyeds": 2,
-        "pomeranians": 3,
-        "akitas": 0,
-        "vizslas": 0,
-        "goldfish": 5,
-        "trees": 3,
-        "cars": 2,
-        "perfumes": 1,
-    }
-
-    master_sue = part_1.Sue(-1, master_traits)
-
-    for compatible_sue in filter(lambda x: compatible(master_sue, x), sues):
-        print(compatible_sue.number)
+        sues = part_1.parse(f)
+
+    for number in solve(sues):
+        print(number)
 
 if __name__ == "__main__":
     import argparse
@@ -40,15 +40,23 @@ def get_combinations(container_sizes, target_amount):
             if sum(combination) == target_amount:
                 yield combination
 
+def parse(fileobj):
+    """Return the list of container sizes contained in the input file"""
+    return [int(line) for line in fileobj]
+
+def solve(container_sizes):
+    """Return the number of combinations that can hold 150 liters"""
+    combinations = get_combinations(container_sizes, 150)
+
+    return sum(1 for _ in combinations)
+
 def main(filename):
     """Read container sizes and find number of combinations that can hold
     150 liters"""
     with open(filename, 'r') as f:
-        container_sizes = [int(line) for line in f]
-
-    combinations = get_combinations(container_sizes, 150)
+        container_sizes = parse(f)
 
-    num_combinations = sum(1 for _ in combinations)
+    num_combinations = solve(container_sizes)
 
     print(num_combinations)
 
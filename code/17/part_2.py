@@ -21,17 +21,33 @@ would be 3.
 
 import part_1
 
-def main(filename):
-    """Read container sizes and count the number of combinations that use
-    the minimum number of containers"""
-    with open(filename, 'r') as f:
-        container_sizes = [int(line) for line in f]
+def solve(container_sizes):
+    """Return the number of combinations that use the minimum number of
+    containers"""
+    combinations = list(part_1.get_combinations(container_sizes, 150))
+
+    min_containers = min(len(x) for x in combinations)
 
+    return sum(1 for x in combinations if len(x) == min_containers)
+
+def solve_both(container_sizes):
+    """Return the answers to both parts, enumerating the combinations once"""
     combinations = list(part_1.get_combinations(container_sizes, 150))
 
     min_containers = min(len(x) for x in combinations)
 
-    num_combinations = sum(1 for x in combinations if len(x) == min_containers)
+    return (
+        len(combinations),
+        sum(1 for x in combinations if len(x) == min_containers),
+    )
+
+def main(filename):
+    """Read container sizes and count the number of combinations that use
+    the minimum number of containers"""
+    with open(filename, 'r') as f:
+        container_sizes = part_1.parse(f)
+
+    num_combinations = solve(container_sizes)
 
     print(num_combinations)
 
@@ -3,26 +3,13 @@
 
 """
 
-import numpy as np
-
 class Grid(object):
     def __init__(self, initial_grid):
         self.grid = initial_grid
 
     @classmethod
     def from_file(cls, fileobj):
-        grid = [
-            [
-                c == "#"
-                for c in line.strip()
-            ]
-            for line in fileobj
-        ]
-
-        np_grid = np.zeros((2+len(grid), 2+len(grid[0])), dtype=bool)
-        np_grid[1:-1, 1:-1] = grid
-
-        return cls(np_grid)
+        return cls(read_grid(fileobj))
 
     def __repr__(self):
         """x
@@ -55,6 +42,8 @@ class Grid(object):
         #.##..
 
         """
+        import numpy as np
+
         previous = self.grid.copy()
 
         for row in range(1, previous.shape[0]-1):
@@ -68,16 +57,57 @@ class Grid(object):
                     self.grid[row, col] = neighbors == 3
 
     def count_lights(self):
+        import numpy as np
+
         return np.sum(self.grid)
 
-def main(filename):
-    with open(filename, 'r') as f:
-        grid = Grid.from_file(f)
+def read_grid(fileobj):
+    """Return the lights as a boolean array padded with a border of off
+    lights
+
+    >>> read_grid(["#.", ".#"]).astype(int)
+    array([[0, 0, 0, 0],
+           [0, 1, 0, 0],
+           [0, 0, 1, 0],
+           [0, 0, 0, 0]])
 
-    for _ in range(100):
+    """
+    import numpy as np
+
+    grid = [
+        [
+            c == "#"
+            for c in line.strip()
+        ]
+        for line in fileobj
+    ]
+
+    np_grid = np.zeros((2+len(grid), 2+len(grid[0])), dtype=bool)
+    np_grid[1:-1, 1:-1] = grid
+
+    return np_grid
+
+def animate(grid, steps):
+    for _ in range(steps):
         grid.step()
 
-    lights = grid.count_lights()
+    return grid.count_lights()
+
+def parse(fileobj):
+    """Return the padded grid of lights contained in the input file"""
+    return read_grid(fileobj)
+
+def solve(initial_grid):
+    """Return the number of lights on after 100 steps"""
+    grid = Grid(initial_grid.copy())
+
+    return animate(grid, 100)
+
+def main(filename):
+    with open(filename, 'r') as f:
+        initial_grid = parse(f)
+
+    lights = solve(initial_grid)
 
     print(lights)
 
@@ -3,8 +3,6 @@
 
 """
 
-import numpy as np
-
 import part_1
 
 class ModifiedGrid(part_1.Grid):
@@ -50,14 +48,17 @@ class ModifiedGrid(part_1.Grid):
         part_1.Grid.step(self)
         self.turn_on_corners()
 
+def solve(initial_grid):
+    """Return the number of lights on after 100 steps with stuck corners"""
+    grid = ModifiedGrid(initial_grid.copy())
+
+    return part_1.animate(grid, 100)
+
 def main(filename):
     with open(filename, 'r') as f:
-        grid = ModifiedGrid.from_file(f)
-
-    for _ in range(100):
-        grid.step()
+        initial_grid = part_1.parse(f)
 
-    lights = grid.count_lights()
+    lights = solve(initial_grid)
 
     print(lights)
 
@@ -38,21 +38,37 @@ class Replacements(object):
             for index in indices:
                 yield molecule[:index] + after + molecule[index+len(before):]
 
-def main(filename):
-    with open(filename, 'r') as f:
-        replacements = Replacements()
-        for line in f:
-            line = line.strip()
-            if line == "":
-                break
+def parse(fileobj):
+    """Return the replacement lines and the molecule from the input file"""
+    replacement_lines = []
+    for line in fileobj:
+        line = line.strip()
+        if line == "":
+            break
+
+        replacement_lines.append(line)
+
+    molecule = fileobj.readline()
+
+    return (replacement_lines, molecule)
 
-            replacements.add(line)
+def solve(parsed):
+    """Return the number of distinct molecules after one replacement"""
+    (replacement_lines, molecule) = parsed
 
-        molecule = f.readline()
+    replacements = Replacements()
+    for line in replacement_lines:
+        replacements.add(line)
 
     possiblities = replacements.possiblities_for(molecule)
 
-    unique_count = len(set(possiblities))
+    return len(set(possiblities))
+
+def main(filename):
+    with open(filename, 'r') as f:
+        parsed = parse(f)
+
+    unique_count = solve(parsed)
 
     print(unique_count)
 
@@ -6,6 +6,8 @@
 import itertools
 import re
 
+import part_1
+
 def number_of_steps(molecule):
     """x
 
@@ -26,18 +28,17 @@ def number_of_steps(molecule):
 
     return steps
 
-def main(filename):
-    with open(filename, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line == "":
-                break
+def solve(parsed):
+    """Return the number of steps to make the molecule from an electron"""
+    (_, molecule) = parsed
 
-            pass
+    return number_of_steps(molecule)
 
-        molecule = f.readline()
+def main(filename):
+    with open(filename, 'r') as f:
+        parsed = part_1.parse(f)
 
-    steps = number_of_steps(molecule)
+    steps = solve(parsed)
     print(steps)
 
 if __name__ == "__main__":
@@ -57,15 +57,24 @@ def divisors_for(number):
             if quotient != divisor:
                 yield number // divisor
 
+def first_house_with(houses, present_threshold):
+    for house_number in itertools.count():
+        if houses.get_number_of_presents(house_number) >= present_threshold:
+            return house_number
+
+def parse(fileobj):
+    """Return the present threshold contained in the input file"""
+    return int(fileobj.readline())
+
+def solve(present_threshold):
+    """Return the first house to get at least the threshold of presents"""
+    return first_house_with(Houses(), present_threshold)
+
 def main(filename):
     with open(filename, 'r') as f:
-        present_threshold = int(f.readline())
-
-    houses = Houses()
+        present_threshold = parse(f)
 
-    for house_number in itertools.count():
-        if houses.get_number_of_presents(house_number) >= present_threshold:
-            break
+    house_number = solve(present_threshold)
 
     print(house_number)
 
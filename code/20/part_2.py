@@ -22,15 +22,15 @@ class ModifiedHouses(part_1.Houses):
     def presents_per_elf(self, elf):
         return 11 * elf
 
+def solve(present_threshold):
+    """Return the first house to get at least the threshold of presents"""
+    return part_1.first_house_with(ModifiedHouses(), present_threshold)
+
 def main(filename):
     with open(filename, 'r') as f:
-        present_threshold = int(f.readline())
-
-    houses = ModifiedHouses()
+        present_threshold = part_1.parse(f)
 
-    for house_number in itertools.count():
-        if houses.get_number_of_presents(house_number) >= present_threshold:
-            break
+    house_number = solve(present_threshold)
 
     print(house_number)
 
@@ -146,10 +146,12 @@ def determine_winner(player, boss):
         if not player.is_living():
             return False
 
-def main(filename):
-    with open(filename, 'r') as f:
-        boss = Character.from_lines(f)
+def parse(fileobj):
+    """Return the boss described in the input file"""
+    return Character.from_lines(fileobj)
 
+def solve(boss):
+    """Return the least gold spent to still win the fight"""
     player_hit_points = 100
     winning_items = []
     for items in all_item_combinations():
@@ -157,7 +159,13 @@ def main(filename):
         if determine_winner(player.copy(), boss.copy()):
             winning_items.append(items)
 
-    min_cost = min(sum(x.cost for x in items) for items in winning_items)
+    return min(sum(x.cost for x in items) for items in winning_items)
+
+def main(filename):
+    with open(filename, 'r') as f:
+        boss = parse(f)
+
+    min_cost = solve(boss)
     print(min_cost)
 
 if __name__ == "__main__":
@@ -5,10 +5,8 @@
 
 import part_1
 
-def main(filename):
-    with open(filename, 'r') as f:
-        boss = part_1.Character.from_lines(f)
-
+def solve(boss):
+    """Return the most gold spent to still lose the fight"""
     player_hit_points = 100
     losing_items = []
     for items in part_1.all_item_combinations():
@@ -16,7 +14,31 @@ def main(filename):
         if not part_1.determine_winner(player.copy(), boss.copy()):
             losing_items.append(items)
 
-    max_cost = max(sum(x.cost for x in items) for items in losing_items)
+    return max(sum(x.cost for x in items) for items in losing_items)
+
+def solve_both(boss):
+    """Return the answers to both parts, fighting each set of items once"""
+    player_hit_points = 100
+    min_winning_cost = None
+    max_losing_cost = None
+    for items in part_1.all_item_combinations():
+        player = part_1.Character.from_items(player_hit_points, items)
+        cost = sum(x.cost for x in items)
+
+        if part_1.determine_winner(player.copy(), boss.copy()):
+            if min_winning_cost is None or cost < min_winning_cost:
+                min_winning_cost = cost
+        else:
+            if max_losing_cost is None or cost > max_losing_cost:
+                max_losing_cost = cost
+
+    return (min_winning_cost, max_losing_cost)
+
+def main(filename):
+    with open(filename, 'r') as f:
+        boss = part_1.parse(f)
+
+    max_cost = solve(boss)
     print(max_cost)
 
 if __name__ == "__main__":
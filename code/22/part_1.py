@@ -106,10 +106,16 @@ def find_solution(boss, player, current_spells=None, players_turn=True):
 
 
 
-def main(filename):
-    with open(filename, 'r') as f:
-        boss_hit_points = int(f.readline().split(': ')[-1])
-        boss_damage = int(f.readline().split(': ')[-1])
+def parse(fileobj):
+    """Return the boss hit points and damage from the input file"""
+    boss_hit_points = int(fileobj.readline().split(': ')[-1])
+    boss_damage = int(fileobj.readline().split(': ')[-1])
+
+    return (boss_hit_points, boss_damage)
+
+def solve(boss_stats):
+    """Return the least mana spent to win the fight"""
+    (boss_hit_points, boss_damage) = boss_stats
 
     player_hit_points = 50
     player_mana = 500
@@ -124,7 +130,13 @@ def main(filename):
             import sys; print("Cost = {}".format(cost), file=sys.stderr)
             lowest_cost_win = cost
 
-    print(lowest_cost_win)
+    return lowest_cost_win
+
+def main(filename):
+    with open(filename, 'r') as f:
+        boss_stats = parse(f)
+
+    print(solve(boss_stats))
 
 if __name__ == "__main__":
     import argparse
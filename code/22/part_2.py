@@ -7,6 +7,8 @@ import enum
 import sys
 import random
 
+import part_1
+
 class Boss(object):
     def __init__(self, hit_points, damage):
         self.hit_points = hit_points
@@ -111,10 +113,9 @@ def find_solution(boss, player, current_spells=None, players_turn=True):
 
 
 
-def main(filename):
-    with open(filename, 'r') as f:
-        boss_hit_points = int(f.readline().split(': ')[-1])
-        boss_damage = int(f.readline().split(': ')[-1])
+def solve(boss_stats):
+    """Return the least mana spent to win the fight"""
+    (boss_hit_points, boss_damage) = boss_stats
 
     player_hit_points = 50
     player_mana = 500
@@ -129,7 +130,13 @@ def main(filename):
             import sys; print("Cost = {}".format(cost), file=sys.stderr)
             lowest_cost_win = cost
 
-    print(lowest_cost_win)
+    return lowest_cost_win
+
+def main(filename):
+    with open(filename, 'r') as f:
+        boss_stats = part_1.parse(f)
+
+    print(solve(boss_stats))
 
 if __name__ == "__main__":
     import argparse
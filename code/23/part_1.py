@@ -111,17 +111,27 @@ def parse_instruction(line):
 
     raise ValueError("Could not parse '{}'".format(line))
 
-def main(filename):
-    with open(filename, 'r') as f:
-        instructions = []
-        for line in f:
-            instructions.append(parse_instruction(line))
-
+def run(instructions):
+    """Run the instructions and return the final value of register b"""
     program = Program(instructions)
     while program.step():
         pass
 
-    register_b = program.state.registers[1]
+    return program.state.registers[1]
+
+def parse(fileobj):
+    """Return the list of instructions contained in the input file"""
+    return [parse_instruction(line) for line in fileobj]
+
+def solve(instructions):
+    """Return the value of register b after running the program"""
+    return run(instructions)
+
+def main(filename):
+    with open(filename, 'r') as f:
+        instructions = parse(f)
+
+    register_b = solve(instructions)
 
     print(register_b)
 
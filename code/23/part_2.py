@@ -5,19 +5,17 @@
 
 import part_1
 
-def main(filename):
-    with open(filename, 'r') as f:
-        instructions = []
-        instructions.append(part_1.parse_instruction('inc a'))
+def solve(instructions):
+    """Return the value of register b when register a starts at 1"""
+    instructions = [part_1.parse_instruction('inc a')] + instructions
 
-        for line in f:
-            instructions.append(part_1.parse_instruction(line))
+    return part_1.run(instructions)
 
-    program = part_1.Program(instructions)
-    while program.step():
-        pass
+def main(filename):
+    with open(filename, 'r') as f:
+        instructions = part_1.parse(f)
 
-    register_b = program.state.registers[1]
+    register_b = solve(instructions)
 
     print(register_b)
 
@@ -33,11 +33,19 @@ def generate_partitions(weights, num_partitions, first_call=True,
 
     return False
 
+def parse(fileobj):
+    """Return the sorted package weights contained in the input file"""
+    return sorted([int(line) for line in fileobj])
+
+def solve(weights):
+    """Return the quantum entanglement of the best first group of three"""
+    return generate_partitions(weights, 3)
+
 def main(filename):
     with open(filename, 'r') as f:
-        weights = sorted([int(line) for line in f])
+        weights = parse(f)
 
-    minimum_qe = generate_partitions(weights, 3)
+    minimum_qe = solve(weights)
 
     print(minimum_qe)
 
@@ -5,11 +5,15 @@
 
 import part_1
 
+def solve(weights):
+    """Return the quantum entanglement of the best first group of four"""
+    return part_1.generate_partitions(weights, 4)
+
 def main(filename):
     with open(filename, 'r') as f:
-        weights = sorted([int(line) for line in f])
+        weights = part_1.parse(f)
 
-    minimum_qe = part_1.generate_partitions(weights, 4)
+    minimum_qe = solve(weights)
 
     print(minimum_qe)
 